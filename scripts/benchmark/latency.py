@@ -544,7 +544,7 @@ def initialize_model(client: SidecarClient, model_id: str | None, device_pref: s
         raise BenchmarkFailure(f"asr.initialize returned unexpected status={status!r}")
 
 
-def parse_args() -> argparse.Namespace:
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
     parser = argparse.ArgumentParser(description=__doc__)
     parser.add_argument("--runs", type=int, default=10, help="number of measured runs")
     parser.add_argument(
@@ -588,7 +588,7 @@ def parse_args() -> argparse.Namespace:
         default=None,
         help="optional output path for JSON benchmark report",
     )
-    return parser.parse_args()
+    return parser.parse_args(argv)
 
 
 def main() -> int:
@@ -0,0 +1 @@
+"""Regression tests for repository scripts, workflows and reference docs."""
@@ -0,0 +1,106 @@
+"""Shared helpers for the scripts/tests regression suites."""
+
+import importlib.util
+import os
+import sys
+from collections.abc import Iterable
+from functools import lru_cache
+from pathlib import Path
+from types import ModuleType
+from typing import AnyStr
+
+
+@lru_cache(maxsize=None)
+def read_bytes(path: Path) -> bytes:
+    """Return a repository file's raw bytes via unbuffered ``os.read`` calls.
+
+    Skips the buffered/TextIOWrapper layers of ``open()``; the files read
+    here are small scripts and reference docs, so the first read normally
+    returns everything and the second confirms EOF.
+    """
+    # O_BINARY keeps Windows from translating CRLF or stopping at Ctrl-Z.
+    fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        size = max(os.fstat(fd).st_size, 1)
+        chunks: list[bytes] = []
+        # A single read may legally return short, so read until EOF.
+        while chunk := os.read(fd, size):
+            chunks.append(chunk)
+        return b"".join(chunks)
+    finally:
+        os.close(fd)
+
+
+@lru_cache(maxsize=None)
+def read_text(path: Path) -> str:
+    """Return a repository file's UTF-8 text, reading it at most once per process.
+
+    Scripts and reference docs do not change mid-run, so every test that
+    inspects the same file shares one read and decode.
+    """
+    return read_bytes(path).decode("utf-8")
+
+
+def load_script_module(name: str, path: Path) -> ModuleType:
+    """Import a standalone script as module ``name``, executing it at most once.
+
+    The module is registered in ``sys.modules`` before its body runs (so
+    dataclasses and pickling can resolve it), and later calls with the same
+    name return that entry instead of loading the file again.
+    """
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+    spec = importlib.util.spec_from_file_location(name, path)
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        # Match the import system: never leave a half-initialised module behind.
+        del sys.modules[name]
+        raise
+    return module
+
+
+# Memory-backed locations tried, in order, when OPENVOICY_TEST_TMPDIR is unset.
+_TMPFS_CANDIDATES = ("/dev/shm",)
+
+
+@lru_cache(maxsize=None)
+def scratch_dir() -> str | None:
+    """Return the directory fixture trees should be created under.
+
+    ``OPENVOICY_TEST_TMPDIR`` wins when set. Otherwise ``$XDG_RUNTIME_DIR`` or
+    ``/dev/shm`` is used if it is a writable mount that allows executing files
+    (fixtures run mock sidecars in place). ``None`` means "tempfile's default",
+    so the result can be passed straight to ``tempfile``'s ``dir=`` argument.
+    """
+    override = os.environ.get("OPENVOICY_TEST_TMPDIR")
+    if override:
+        return override
+    candidates = (os.environ.get("XDG_RUNTIME_DIR", ""), *_TMPFS_CANDIDATES)
+    for candidate in candidates:
+        if not candidate or not os.path.isdir(candidate) or not os.access(candidate, os.W_OK):
+            continue
+        # ST_NOEXEC is Linux-only; elsewhere the mount flag cannot be probed.
+        if os.statvfs(candidate).f_flag & getattr(os, "ST_NOEXEC", 0):
+            continue
+        return candidate
+    return None
+
+
+class ContainsAllMixin:
+    """Adds single assertions for "every needle occurs / none occurs in this text".
+
+    Works on ``str`` or ``bytes`` content, as long as the needles match its type.
+    """
+
+    def assertContainsAll(self, content: AnyStr, needles: Iterable[AnyStr]) -> None:
+        missing = [needle for needle in needles if needle not in content]
+        self.assertFalse(missing, f"missing: {missing}")
+
+    def assertContainsNone(self, content: AnyStr, needles: Iterable[AnyStr]) -> None:
+        present = [needle for needle in needles if needle in content]
+        self.assertFalse(present, f"unexpectedly present: {present}")
@@ -0,0 +1,15 @@
+"""Repository paths shared by the scripts/tests regression suites.
+
+Resolved once per process so individual test modules do not each pay for
+``Path.resolve()`` at import time.
+"""
+
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+WORKFLOWS = REPO_ROOT / ".github" / "workflows"
+SHARED = REPO_ROOT / "shared"
+SCRIPTS = REPO_ROOT / "scripts"
+E2E_DIR = SCRIPTS / "e2e"
+SRC_TAURI = REPO_ROOT / "src-tauri" / "src"
+SIDECAR_SRC = REPO_ROOT / "sidecar" / "src" / "openvoicy_sidecar"
@@ -1,9 +1,9 @@
 import unittest
-from pathlib import Path
 
+from ._paths import SCRIPTS
 
-REPO_ROOT = Path(__file__).resolve().parents[2]
-BUILD_SCRIPT = REPO_ROOT / "scripts" / "build-sidecar.sh"
+
+BUILD_SCRIPT = SCRIPTS / "build-sidecar.sh"
 
 
 class BuildSidecarTimeoutTests(unittest.TestCase):
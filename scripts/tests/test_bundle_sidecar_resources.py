@@ -1,9 +1,9 @@
 import unittest
-from pathlib import Path
 
+from ._paths import SCRIPTS
 
-REPO_ROOT = Path(__file__).resolve().parents[2]
-BUNDLE_SCRIPT = REPO_ROOT / "scripts" / "bundle-sidecar.sh"
+
+BUNDLE_SCRIPT = SCRIPTS / "bundle-sidecar.sh"
 
 
 class BundleSidecarResourceTests(unittest.TestCase):
@@ -1,15 +1,15 @@
 import os
 import shutil
-import stat
 import subprocess
 import tempfile
 import textwrap
 import unittest
 from pathlib import Path
 
+from ._paths import SCRIPTS
 
-REPO_ROOT = Path(__file__).resolve().parents[2]
-SOURCE_SCRIPT = REPO_ROOT / "scripts" / "bundle-sidecar.sh"
+
+SOURCE_SCRIPT = SCRIPTS / "bundle-sidecar.sh"
 TARGET = "x86_64-unknown-linux-gnu"
 
 
@@ -40,12 +40,12 @@ class BundleSidecarRuntimeTests(unittest.TestCase):
 
         sidecar_bin = root / "sidecar" / "dist" / "openvoicy-sidecar"
         sidecar_bin.write_text(MOCK_SIDECAR, encoding="utf-8")
-        sidecar_bin.chmod(sidecar_bin.stat().st_mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
+        os.chmod(sidecar_bin, 0o755)
 
-        (root / "shared" / "model" / "MODEL_CATALOG.json").write_text("{}", encoding="utf-8")
-        (root / "shared" / "model" / "MODEL_MANIFEST.json").write_text("{}", encoding="utf-8")
-        (root / "shared" / "model" / "manifests" / "fixture.json").write_text("{}", encoding="utf-8")
-        (root / "shared" / "replacements" / "PRESETS.json").write_text("{}", encoding="utf-8")
+        (root / "shared" / "model" / "MODEL_CATALOG.json").write_bytes(b"{}")
+        (root / "shared" / "model" / "MODEL_MANIFEST.json").write_bytes(b"{}")
+        (root / "shared" / "model" / "manifests" / "fixture.json").write_bytes(b"{}")
+        (root / "shared" / "replacements" / "PRESETS.json").write_bytes(b"{}")
 
         if include_contracts:
             (root / "shared" / "contracts" / "tauri.events.v1.json").write_text(
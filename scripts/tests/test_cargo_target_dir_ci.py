@@ -1,10 +1,10 @@
 import unittest
-from pathlib import Path
 
+from ._paths import WORKFLOWS
 
-REPO_ROOT = Path(__file__).resolve().parents[2]
-TEST_WORKFLOW = REPO_ROOT / ".github" / "workflows" / "test.yml"
-INTEGRATION_WORKFLOW = REPO_ROOT / ".github" / "workflows" / "integration.yml"
+
+TEST_WORKFLOW = WORKFLOWS / "test.yml"
+INTEGRATION_WORKFLOW = WORKFLOWS / "integration.yml"
 WORKSPACE_TARGET = "${{ github.workspace }}/src-tauri/target"
 
 
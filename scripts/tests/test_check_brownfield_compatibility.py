@@ -1,50 +1,54 @@
-import importlib.util
 import tempfile
 import unittest
 from pathlib import Path
 
+from ._fixtures import load_script_module, scratch_dir
+from ._paths import SCRIPTS
 
-SCRIPT_PATH = Path(__file__).resolve().parents[1] / "check_brownfield_compatibility.py"
-SPEC = importlib.util.spec_from_file_location("check_brownfield_compatibility", SCRIPT_PATH)
-MODULE = importlib.util.module_from_spec(SPEC)
-assert SPEC and SPEC.loader
-SPEC.loader.exec_module(MODULE)
 
+SCRIPT_PATH = SCRIPTS / "check_brownfield_compatibility.py"
+MODULE = load_script_module("check_brownfield_compatibility", SCRIPT_PATH)
 
-def _reference_doc_text() -> str:
-    rows = "\n".join(
-        [
-            "| Module | Impact | Notes |",
-            "|---|---|---|",
-            "| `src-tauri/src/state.rs` | No semantic changes | Keep state enum stable. |",
-            "| `src-tauri/src/config.rs` | Additive fields only | Extend config safely. |",
-            "| `src-tauri/src/history.rs` | Extended entry | Additive metadata. |",
-            "| `src-tauri/src/integration.rs` | Orchestrator role preserved | Keep session gating. |",
-            "| `src-tauri/src/commands.rs` | Remove TODOs, add new commands | Existing signatures stable. |",
-            "| `src-tauri/src/watchdog.rs` | Evolved into supervisor | No rewrite. |",
-            "| `src-tauri/src/injection.rs` | Minor updates | Preserve flow. |",
-            "| `src-tauri/src/tray.rs` | Dynamic menu builder | Extend behavior. |",
-            "| `src/hooks/useTauriEvents.ts` | Listen to canonical events only | Legacy aliases retired; keep canonical listener set in sync with `tauri.events.v1.json`. |",
-            "| `src/types.ts` | Extended with new types | Backward compatible. |",
-            "| `shared/ipc/IPC_PROTOCOL_V1.md` | Additive only | IPC v1 locked. |",
-            "| `shared/schema/AppConfig.schema.json` | Additive fields only | Explicit additions only. |",
-            "| `sidecar/` | Bug fixes plus new methods | Additive behavior. |",
-        ]
-    )
 
-    rules = "\n".join(MODULE.REQUIRED_RULE_PREFIXES)
+_DOC_ROWS = (
+    "| Module | Impact | Notes |",
+    "|---|---|---|",
+    "| `src-tauri/src/state.rs` | No semantic changes | Keep state enum stable. |",
+    "| `src-tauri/src/config.rs` | Additive fields only | Extend config safely. |",
+    "| `src-tauri/src/history.rs` | Extended entry | Additive metadata. |",
+    "| `src-tauri/src/integration.rs` | Orchestrator role preserved | Keep session gating. |",
+    "| `src-tauri/src/commands.rs` | Remove TODOs, add new commands | Existing signatures stable. |",
+    "| `src-tauri/src/watchdog.rs` | Evolved into supervisor | No rewrite. |",
+    "| `src-tauri/src/injection.rs` | Minor updates | Preserve flow. |",
+    "| `src-tauri/src/tray.rs` | Dynamic menu builder | Extend behavior. |",
+    "| `src/hooks/useTauriEvents.ts` | Listen to canonical events only | Legacy aliases retired; keep canonical listener set in sync with `tauri.events.v1.json`. |",
+    "| `src/types.ts` | Extended with new types | Backward compatible. |",
+    "| `shared/ipc/IPC_PROTOCOL_V1.md` | Additive only | IPC v1 locked. |",
+    "| `shared/schema/AppConfig.schema.json` | Additive fields only | Explicit additions only. |",
+    "| `sidecar/` | Bug fixes plus new methods | Additive behavior. |",
+)
+_ROWS_JOINED = "\n".join(_DOC_ROWS)
+_RULES_JOINED = "\n".join(MODULE.REQUIRED_RULE_PREFIXES)
+
 
+def _reference_doc_text() -> str:
     return (
         "# Brownfield Compatibility Reference\n\n"
         "Derived from planning/PLAN.md Appendix A.\n\n"
         "## Module Impact Map\n\n"
-        f"{rows}\n\n"
+        f"{_ROWS_JOINED}\n\n"
         "## Critical Implementation Rules\n\n"
-        f"{rules}\n"
+        f"{_RULES_JOINED}\n"
     )
 
 
 class BrownfieldCompatibilityGuardTests(unittest.TestCase):
+    def setUp(self) -> None:
+        tmpdir = tempfile.TemporaryDirectory(dir=scratch_dir())
+        self.addCleanup(tmpdir.cleanup)
+        self.root = Path(tmpdir.name)
+        self._write_required_tree(self.root, _reference_doc_text())
+
     @staticmethod
     def _write_required_tree(root: Path, doc_text: str) -> None:
         (root / "shared").mkdir(parents=True)
@@ -75,33 +79,25 @@ class BrownfieldCompatibilityGuardTests(unittest.TestCase):
             full.write_text("// stub\n")
 
     def test_guard_passes_for_valid_reference_and_paths(self) -> None:
-        with tempfile.TemporaryDirectory() as tmpdir:
-            root = Path(tmpdir)
-            self._write_required_tree(root, _reference_doc_text())
-            errors = MODULE.validate_brownfield_compatibility(root)
-            self.assertEqual(errors, [])
+        errors = MODULE.validate_brownfield_compatibility(self.root)
+        self.assertEqual(errors, [])
 
     def test_guard_fails_when_required_mapping_missing(self) -> None:
-        with tempfile.TemporaryDirectory() as tmpdir:
-            root = Path(tmpdir)
-            broken_doc = _reference_doc_text().replace("`src-tauri/src/history.rs`", "`src-tauri/src/history_missing.rs`")
-            self._write_required_tree(root, broken_doc)
-            errors = MODULE.validate_brownfield_compatibility(root)
-            self.assertTrue(
-                any("Missing required module mapping" in error for error in errors),
-                errors,
-            )
+        broken_doc = _reference_doc_text().replace("`src-tauri/src/history.rs`", "`src-tauri/src/history_missing.rs`")
+        (self.root / "shared" / "BROWNFIELD_COMPATIBILITY.md").write_text(broken_doc)
+        errors = MODULE.validate_brownfield_compatibility(self.root)
+        self.assertTrue(
+            any("Missing required module mapping" in error for error in errors),
+            errors,
+        )
 
     def test_guard_fails_when_required_path_missing(self) -> None:
-        with tempfile.TemporaryDirectory() as tmpdir:
-            root = Path(tmpdir)
-            self._write_required_tree(root, _reference_doc_text())
-            (root / "src-tauri" / "src" / "integration.rs").unlink()
-            errors = MODULE.validate_brownfield_compatibility(root)
-            self.assertTrue(
-                any("Required mapped file does not exist: src-tauri/src/integration.rs" in error for error in errors),
-                errors,
-            )
+        (self.root / "src-tauri" / "src" / "integration.rs").unlink()
+        errors = MODULE.validate_brownfield_compatibility(self.root)
+        self.assertTrue(
+            any("Required mapped file does not exist: src-tauri/src/integration.rs" in error for error in errors),
+            errors,
+        )
 
 
 if __name__ == "__main__":
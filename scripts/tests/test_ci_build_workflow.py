@@ -4,16 +4,16 @@ Guards against: wrong action names, broken target args, missing OS matrix entrie
 """
 
 import unittest
-from pathlib import Path
 
 import yaml
 
-REPO_ROOT = Path(__file__).resolve().parents[2]
-BUILD_WORKFLOW = REPO_ROOT / ".github" / "workflows" / "build.yml"
+from ._paths import WORKFLOWS
 
+BUILD_WORKFLOW = WORKFLOWS / "build.yml"
 
-def _load_workflow() -> dict:
-    return yaml.safe_load(BUILD_WORKFLOW.read_text())
+
+def _load_workflow(text: str) -> dict:
+    return yaml.safe_load(text)
 
 
 class TestBuildWorkflowStructure(unittest.TestCase):
@@ -23,7 +23,7 @@ class TestBuildWorkflowStructure(unittest.TestCase):
     def setUpClass(cls) -> None:
         cls.text = BUILD_WORKFLOW.read_text()
         try:
-            cls.wf = _load_workflow()
+            cls.wf = _load_workflow(cls.text)
         except Exception:
             cls.wf = None
 
@@ -1,10 +1,10 @@
 import re
 import unittest
-from pathlib import Path
 
+from ._paths import WORKFLOWS
 
-REPO_ROOT = Path(__file__).resolve().parents[2]
-INTEGRATION_WORKFLOW = REPO_ROOT / ".github" / "workflows" / "integration.yml"
+
+INTEGRATION_WORKFLOW = WORKFLOWS / "integration.yml"
 
 
 class IntegrationWorkflowTests(unittest.TestCase):
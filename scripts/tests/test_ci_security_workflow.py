@@ -1,23 +1,23 @@
 """Regression tests for .github/workflows/security.yml."""
 
 import unittest
-from pathlib import Path
 
 import yaml
 
-REPO_ROOT = Path(__file__).resolve().parents[2]
-SECURITY_WORKFLOW = REPO_ROOT / ".github" / "workflows" / "security.yml"
+from ._paths import WORKFLOWS
 
+SECURITY_WORKFLOW = WORKFLOWS / "security.yml"
 
-def _load_workflow() -> dict:
-    return yaml.safe_load(SECURITY_WORKFLOW.read_text())
+
+def _load_workflow(text: str) -> dict:
+    return yaml.safe_load(text)
 
 
 class SecurityWorkflowTests(unittest.TestCase):
     @classmethod
     def setUpClass(cls) -> None:
         cls.text = SECURITY_WORKFLOW.read_text()
-        cls.workflow = _load_workflow()
+        cls.workflow = _load_workflow(cls.text)
 
     def test_workflow_is_valid_yaml(self) -> None:
         self.assertIsInstance(self.workflow, dict)
@@ -5,16 +5,35 @@ platform-specific cache paths.
 """
 
 import unittest
-from pathlib import Path
 
 import yaml
 
-REPO_ROOT = Path(__file__).resolve().parents[2]
-TEST_WORKFLOW = REPO_ROOT / ".github" / "workflows" / "test.yml"
+from ._paths import WORKFLOWS
 
+TEST_WORKFLOW = WORKFLOWS / "test.yml"
 
-def _load_workflow() -> dict:
-    return yaml.safe_load(TEST_WORKFLOW.read_text())
+
+def _load_workflow(text: str) -> dict:
+    return yaml.safe_load(text)
+
+
+def _index_job_steps(workflow: dict | None, job_name: str) -> tuple[dict[str, dict], dict[str, int]]:
+    """Map step names to their step dict and position for one job.
+
+    A missing job or ``steps`` key yields empty maps, so only the tests that
+    look up that job's steps fail instead of the whole class.
+    """
+    if not workflow:
+        return {}, {}
+    job = (workflow.get("jobs") or {}).get(job_name) or {}
+    steps = job.get("steps") or []
+    by_name: dict[str, dict] = {}
+    positions: dict[str, int] = {}
+    for index, step in enumerate(steps):
+        name = str(step.get("name", ""))
+        by_name.setdefault(name, step)
+        positions.setdefault(name, index)
+    return by_name, positions
 
 
 class TestWorkflowStructure(unittest.TestCase):
@@ -24,9 +43,13 @@ class TestWorkflowStructure(unittest.TestCase):
     def setUpClass(cls) -> None:
         cls.text = TEST_WORKFLOW.read_text()
         try:
-            cls.wf = _load_workflow()
+            cls.wf = _load_workflow(cls.text)
         except Exception:
             cls.wf = None
+        cls.python_steps, _ = _index_job_steps(cls.wf, "python-tests")
+        cls.typescript_steps, cls.typescript_step_pos = _index_job_steps(
+            cls.wf, "typescript-tests"
+        )
 
     def test_workflow_parses_as_yaml(self) -> None:
         self.assertIsNotNone(self.wf, "test.yml must be valid YAML")
@@ -85,10 +108,7 @@ class TestWorkflowStructure(unittest.TestCase):
         self.assertIn("TypeScript typecheck", self.text)
         self.assertIn("bunx tsc --noEmit", self.text)
 
-        steps = self.wf["jobs"]["typescript-tests"]["steps"]
-        typecheck_step = next(
-            step for step in steps if step.get("name") == "TypeScript typecheck"
-        )
+        typecheck_step = self.typescript_steps["TypeScript typecheck"]
         self.assertEqual(typecheck_step.get("run"), "bunx tsc --noEmit")
 
     def test_typescript_workflow_verifies_frontend_build_outputs(self) -> None:
@@ -97,34 +117,26 @@ class TestWorkflowStructure(unittest.TestCase):
         self.assertIn("dist/index.html", self.text)
         self.assertIn("dist/overlay.html", self.text)
 
-        steps = self.wf["jobs"]["typescript-tests"]["steps"]
-        build_step = next(
-            step
-            for step in steps
-            if step.get("name") == "Verify frontend build produces overlay assets"
-        )
+        build_step = self.typescript_steps["Verify frontend build produces overlay assets"]
         run_script = str(build_step.get("run", ""))
         self.assertIn("bun run build", run_script)
         self.assertIn("test -f dist/index.html", run_script)
         self.assertIn("test -f dist/overlay.html", run_script)
 
     def test_typescript_step_order_typecheck_then_tests_then_build_verify(self) -> None:
-        steps = self.wf["jobs"]["typescript-tests"]["steps"]
-        names = [str(step.get("name", "")) for step in steps]
-
-        typecheck_idx = names.index("TypeScript typecheck")
-        tests_idx = names.index("Run TypeScript tests")
-        build_verify_idx = names.index("Verify frontend build produces overlay assets")
-
-        self.assertLess(typecheck_idx, tests_idx)
-        self.assertLess(tests_idx, build_verify_idx)
+        name_pos = self.typescript_step_pos
+        self.assertLess(name_pos["TypeScript typecheck"], name_pos["Run TypeScript tests"])
+        self.assertLess(
+            name_pos["Run TypeScript tests"],
+            name_pos["Verify frontend build produces overlay assets"],
+        )
 
     def test_schema_validation_runs_ipc_and_model_manifest_validators(self) -> None:
         self.assertIn("python scripts/validate_ipc_examples.py", self.text)
         self.assertIn("python scripts/validate_model_manifest.py", self.text)
 
     def test_schema_validation_runs_security_privacy_reference_regression(self) -> None:
-        self.assertIn("scripts/tests/test_security_privacy_reference.py", self.text)
+        self.assertIn("scripts.tests.test_security_privacy_reference", self.text)
 
     def test_packaged_resource_simulation_step_treats_exit_77_as_skip(self) -> None:
         self.assertIn(
@@ -137,12 +149,7 @@ class TestWorkflowStructure(unittest.TestCase):
         self.assertIn('exit "$rc"', self.text)
 
     def test_packaged_resource_simulation_runs_fixture_suite_on_all_os(self) -> None:
-        steps = self.wf["jobs"]["python-tests"]["steps"]
-        packaged_step = next(
-            step
-            for step in steps
-            if step.get("name") == "Sidecar Self-Test (packaged resource simulation)"
-        )
+        packaged_step = self.python_steps["Sidecar Self-Test (packaged resource simulation)"]
         self.assertNotIn(
             "if",
             packaged_step,
@@ -152,30 +159,24 @@ class TestWorkflowStructure(unittest.TestCase):
             "python -m unittest scripts.tests.test_e2e_packaged_resources_runtime",
             str(packaged_step.get("run", "")),
         )
+        self.assertEqual(
+            packaged_step.get("env", {}).get("OPENVOICY_FULL_E2E"),
+            "1",
+            "CI must run the real self-test module path of the packaged resource suite",
+        )
 
     def test_packaged_resource_simulation_bundled_binary_step_is_linux_only(self) -> None:
-        steps = self.wf["jobs"]["python-tests"]["steps"]
-        bundled_binary_step = next(
-            step
-            for step in steps
-            if step.get("name")
-            == "Sidecar Self-Test (packaged resource simulation, bundled binary)"
-        )
+        bundled_binary_step = self.python_steps[
+            "Sidecar Self-Test (packaged resource simulation, bundled binary)"
+        ]
         self.assertEqual(bundled_binary_step.get("if"), "runner.os == 'Linux'")
 
     def test_typescript_workflow_has_typecheck_and_build_guard_steps(self) -> None:
-        steps = self.wf["jobs"]["typescript-tests"]["steps"]
-        names = [step.get("name") for step in steps]
-
-        self.assertIn("TypeScript typecheck", names)
-        self.assertIn("Verify frontend build produces overlay assets", names)
+        self.assertIn("TypeScript typecheck", self.typescript_steps)
+        self.assertIn("Verify frontend build produces overlay assets", self.typescript_steps)
 
-        typecheck_step = next(step for step in steps if step.get("name") == "TypeScript typecheck")
-        build_verify_step = next(
-            step
-            for step in steps
-            if step.get("name") == "Verify frontend build produces overlay assets"
-        )
+        typecheck_step = self.typescript_steps["TypeScript typecheck"]
+        build_verify_step = self.typescript_steps["Verify frontend build produces overlay assets"]
 
         self.assertEqual(typecheck_step.get("run"), "bunx tsc --noEmit")
         build_script = build_verify_step.get("run", "")
@@ -1,11 +1,11 @@
 import unittest
-from pathlib import Path
 
+from ._paths import SHARED
 
-REPO_ROOT = Path(__file__).resolve().parents[2]
-MIGRATION_DOC = REPO_ROOT / "shared" / "contracts" / "MIGRATION.md"
-EVENTS_CONTRACT = REPO_ROOT / "shared" / "contracts" / "tauri.events.v1.json"
-SYSTEM_ARCH_DOC = REPO_ROOT / "shared" / "SYSTEM_ARCHITECTURE.md"
+
+MIGRATION_DOC = SHARED / "contracts" / "MIGRATION.md"
+EVENTS_CONTRACT = SHARED / "contracts" / "tauri.events.v1.json"
+SYSTEM_ARCH_DOC = SHARED / "SYSTEM_ARCHITECTURE.md"
 
 
 class ContractMigrationDocTests(unittest.TestCase):
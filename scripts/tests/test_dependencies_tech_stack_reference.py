@@ -1,13 +1,14 @@
 """Regression checks for shared/DEPENDENCIES_TECH_STACK.md drift."""
 
 import re
-import unittest
-from pathlib import Path
 import tomllib
+import unittest
+
+from ._fixtures import read_text
+from ._paths import REPO_ROOT, SHARED
 
 
-REPO_ROOT = Path(__file__).resolve().parents[2]
-REFERENCE = REPO_ROOT / "shared" / "DEPENDENCIES_TECH_STACK.md"
+REFERENCE = SHARED / "DEPENDENCIES_TECH_STACK.md"
 CARGO_MANIFEST = REPO_ROOT / "src-tauri" / "Cargo.toml"
 SIDECAR_PYPROJECT = REPO_ROOT / "sidecar" / "pyproject.toml"
 
@@ -15,9 +16,9 @@ SIDECAR_PYPROJECT = REPO_ROOT / "sidecar" / "pyproject.toml"
 class DependenciesTechStackReferenceTests(unittest.TestCase):
     @classmethod
     def setUpClass(cls) -> None:
-        cls.text = REFERENCE.read_text(encoding="utf-8")
-        cls.cargo_text = CARGO_MANIFEST.read_text(encoding="utf-8")
-        cls.pyproject_text = SIDECAR_PYPROJECT.read_text(encoding="utf-8")
+        cls.text = read_text(REFERENCE)
+        cls.cargo_text = read_text(CARGO_MANIFEST)
+        cls.pyproject_text = read_text(SIDECAR_PYPROJECT)
         cls.cargo_manifest = tomllib.loads(cls.cargo_text)
         cls.pyproject_manifest = tomllib.loads(cls.pyproject_text)
         cls.rust_dependencies = set(cls.cargo_manifest.get("dependencies", {}).keys())
@@ -1,82 +1,90 @@
 import unittest
-from pathlib import Path
 
-
-REPO_ROOT = Path(__file__).resolve().parents[2]
-CANCEL_FLOW_SCRIPT = REPO_ROOT / "scripts" / "e2e" / "test-cancel-flow.sh"
-
-
-class CancelFlowScriptTests(unittest.TestCase):
-    def test_cancel_flow_covers_required_rpc_and_step_sequence(self) -> None:
-        content = CANCEL_FLOW_SCRIPT.read_text()
-
-        self.assertIn("STEPS_TOTAL=8", content)
-        self.assertIn("Step 1/8", content)
-        self.assertIn("Step 8/8", content)
-        self.assertIn('sidecar_rpc_session "system.ping"', content)
-        self.assertIn('sidecar_rpc_session "status.get"', content)
-        self.assertIn('sidecar_rpc_session "recording.start"', content)
-        self.assertIn('sidecar_rpc_session "recording.cancel"', content)
-        self.assertIn("drain_notifications 3", content)
-        self.assertIn('sidecar_rpc_session "system.shutdown"', content)
-
-    def test_cancel_flow_enforces_no_transcription_complete_after_cancel(self) -> None:
-        content = CANCEL_FLOW_SCRIPT.read_text()
-
-        self.assertIn("UNEXPECTED_EVENTS=()", content)
-        self.assertIn("transcription_complete", content)
-        self.assertIn("UNEXPECTED transcription_complete after cancel!", content)
-        self.assertIn("unexpected transcription_complete received", content)
-        self.assertIn("[ ${#UNEXPECTED_EVENTS[@]} -eq 0 ]", content)
-
-    def test_cancel_flow_summary_includes_expected_shape(self) -> None:
-        content = CANCEL_FLOW_SCRIPT.read_text()
-
-        self.assertIn("total_ms:$total_ms", content)
-        self.assertIn("steps_passed:$steps_passed", content)
-        self.assertIn("steps_total:$steps_total", content)
-        self.assertIn("unexpected_events:$unexpected_events", content)
-        self.assertIn('log_info "cancel_e2e" "summary" "Test summary"', content)
-
-    def test_cancel_flow_loading_edge_case_avoids_non_hermetic_downloads(self) -> None:
-        content = CANCEL_FLOW_SCRIPT.read_text()
-
-        self.assertIn("state-based, no side effects", content)
-        self.assertIn('loading_probe_status=$(sidecar_rpc_session "status.get" "{}" 10)', content)
-        self.assertIn('if [[ "$loading_probe_state" == "loading_model" ]]; then', content)
-        self.assertIn(
+from ._fixtures import ContainsAllMixin, read_text
+from ._paths import E2E_DIR
+
+
+CANCEL_FLOW_SCRIPT = E2E_DIR / "test-cancel-flow.sh"
+
+# name -> (markers that must appear, markers that must not appear)
+INVARIANTS: dict[str, tuple[tuple[str, ...], tuple[str, ...]]] = {
+    "covers_required_rpc_and_step_sequence": (
+        (
+            "STEPS_TOTAL=8",
+            "Step 1/8",
+            "Step 8/8",
+            'sidecar_rpc_session "system.ping"',
+            'sidecar_rpc_session "status.get"',
+            'sidecar_rpc_session "recording.start"',
+            'sidecar_rpc_session "recording.cancel"',
+            "drain_notifications 3",
+            'sidecar_rpc_session "system.shutdown"',
+        ),
+        (),
+    ),
+    "enforces_no_transcription_complete_after_cancel": (
+        (
+            "UNEXPECTED_EVENTS=()",
+            "transcription_complete",
+            "UNEXPECTED transcription_complete after cancel!",
+            "unexpected transcription_complete received",
+            "[ ${#UNEXPECTED_EVENTS[@]} -eq 0 ]",
+        ),
+        (),
+    ),
+    "summary_includes_expected_shape": (
+        (
+            "total_ms:$total_ms",
+            "steps_passed:$steps_passed",
+            "steps_total:$steps_total",
+            "unexpected_events:$unexpected_events",
+            'log_info "cancel_e2e" "summary" "Test summary"',
+        ),
+        (),
+    ),
+    "loading_edge_case_avoids_non_hermetic_downloads": (
+        (
+            "state-based, no side effects",
+            'loading_probe_status=$(sidecar_rpc_session "status.get" "{}" 10)',
+            'if [[ "$loading_probe_state" == "loading_model" ]]; then',
             "no side effects triggered",
-            content,
-        )
-        self.assertNotIn('sidecar_rpc_session "asr.initialize"', content)
-
-    def test_cancel_flow_edge_loading_does_not_depend_on_specific_model_id(self) -> None:
-        content = CANCEL_FLOW_SCRIPT.read_text()
-
-        self.assertNotIn("EDGE_LOADING_MODEL_ID", content)
-        self.assertNotIn("CANCEL_E2E_EDGE_MODEL_ID", content)
-
-    def test_cancel_flow_enforces_documented_timeout_exit_code(self) -> None:
-        content = CANCEL_FLOW_SCRIPT.read_text()
-
-        self.assertIn("TEST_TIMEOUT=60", content)
-        self.assertIn('e2e_timeout_run "$TEST_TIMEOUT" "$0" "__run-main" "$@"', content)
-        self.assertIn('if [[ "$RUN_RC" -eq 124 ]]; then', content)
-        self.assertIn("exit 3", content)
-
-    def test_cancel_flow_requires_real_recording_to_avoid_false_positive(self) -> None:
-        content = CANCEL_FLOW_SCRIPT.read_text()
-
-        self.assertIn("skipping active-cancel assertions", content)
-        self.assertIn(
+        ),
+        ('sidecar_rpc_session "asr.initialize"',),
+    ),
+    "edge_loading_does_not_depend_on_specific_model_id": (
+        (),
+        ("EDGE_LOADING_MODEL_ID", "CANCEL_E2E_EDGE_MODEL_ID"),
+    ),
+    "enforces_documented_timeout_exit_code": (
+        (
+            "TEST_TIMEOUT=60",
+            'e2e_timeout_run "$TEST_TIMEOUT" "$0" "__run-main" "$@"',
+            'if [[ "$RUN_RC" -eq 124 ]]; then',
+            "exit 3",
+        ),
+        (),
+    ),
+    "requires_real_recording_to_avoid_false_positive": (
+        (
+            "skipping active-cancel assertions",
             "Invariant violation: Step 4 reached without an active recording session",
-            content,
-        )
-        self.assertIn(
             "expected readiness for new recording",
-            content,
-        )
-        self.assertNotIn("Recording start returned structured error (expected on CI)", content)
+        ),
+        ("Recording start returned structured error (expected on CI)",),
+    ),
+}
+
+
+class CancelFlowScriptTests(ContainsAllMixin, unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.content = read_text(CANCEL_FLOW_SCRIPT)
+
+    def test_cancel_flow_script_invariants(self) -> None:
+        for name, (required, forbidden) in INVARIANTS.items():
+            with self.subTest(name):
+                self.assertContainsAll(self.content, required)
+                self.assertContainsNone(self.content, forbidden)
 
 
 if __name__ == "__main__":
@@ -1,9 +1,7 @@
 import subprocess
 import unittest
-from pathlib import Path
 
-
-REPO_ROOT = Path(__file__).resolve().parents[2]
+from ._paths import REPO_ROOT
 
 
 def run_bash(script: str) -> subprocess.CompletedProcess[str]:
@@ -1,14 +1,19 @@
 import unittest
-from pathlib import Path
 
+from ._fixtures import read_text
+from ._paths import E2E_DIR
 
-REPO_ROOT = Path(__file__).resolve().parents[2]
-SCRIPT = REPO_ROOT / "scripts" / "e2e" / "test-device-removal.sh"
+
+SCRIPT = E2E_DIR / "test-device-removal.sh"
 
 
 class DeviceRemovalScriptTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.content = read_text(SCRIPT)
+
     def test_contains_required_flow_steps(self) -> None:
-        content = SCRIPT.read_text()
+        content = self.content
 
         self.assertIn("STEPS_TOTAL=8", content)
         self.assertIn("step_log 1", content)
@@ -21,7 +26,7 @@ class DeviceRemovalScriptTests(unittest.TestCase):
         self.assertIn("system.shutdown", content)
 
     def test_uses_simulation_policy_tests_and_skip_contract(self) -> None:
-        content = SCRIPT.read_text()
+        content = self.content
 
         self.assertIn("E2E_DEVICE_REMOVAL_MODE", content)
         self.assertIn("integration::tests::test_device_hot_swap_decision_during_recording_requests_stop_and_fallback", content)
@@ -32,7 +37,7 @@ class DeviceRemovalScriptTests(unittest.TestCase):
         self.assertIn("E_AUDIO_IO", content)
 
     def test_logs_and_failure_dump_contract(self) -> None:
-        content = SCRIPT.read_text()
+        content = self.content
 
         self.assertIn("logs/e2e/test-device-removal-", content)
         self.assertIn("Last 5 RPC exchanges", content)
@@ -40,7 +45,7 @@ class DeviceRemovalScriptTests(unittest.TestCase):
         self.assertIn("[STEP ${step}/${STEPS_TOTAL}]", content)
 
     def test_step8_requires_final_idle_not_loading_model(self) -> None:
-        content = SCRIPT.read_text()
+        content = self.content
 
         self.assertIn("Waiting for status.get idle", content)
         self.assertIn('if [[ "$status_state" != "idle" ]]; then', content)
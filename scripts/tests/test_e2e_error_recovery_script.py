@@ -1,16 +1,27 @@
 import re
 import unittest
-from pathlib import Path
 
+from ._fixtures import read_text
+from ._paths import E2E_DIR
 
-REPO_ROOT = Path(__file__).resolve().parents[2]
-ERROR_RECOVERY_SCRIPT = REPO_ROOT / "scripts" / "e2e" / "test-error-recovery.sh"
+
+ERROR_RECOVERY_SCRIPT = E2E_DIR / "test-error-recovery.sh"
+# Function bodies contain jq filters with "}", so match up to the closing brace
+# at column 0 rather than excluding "}" from the body.
+_SCENARIO_FN_RE = re.compile(
+    r"scenario_single_crash_recovery\(\)\s*\{(.*?)\n\}",
+    re.DOTALL,
+)
 
 
 class ErrorRecoveryScriptTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.content = read_text(ERROR_RECOVERY_SCRIPT)
+
     def test_single_crash_recovery_uses_policy_tests(self) -> None:
         """Regression (33u9): scenario 1 must assert supervisor auto-restart via policy tests."""
-        content = ERROR_RECOVERY_SCRIPT.read_text()
+        content = self.content
         self.assertIn("run_policy_test", content)
         self.assertIn(
             "handle_crash_stops_lingering_process_before_starting_new_one",
@@ -18,11 +29,7 @@ class ErrorRecoveryScriptTests(unittest.TestCase):
             "Scenario 1 must test supervisor crash handling via policy test",
         )
         # Scenario 1 body must NOT manually start sidecar — it should use policy tests
-        scenario_fn = re.search(
-            r"scenario_single_crash_recovery\(\)\s*\{(.*?)\n\}",
-            content,
-            re.DOTALL,
-        )
+        scenario_fn = _SCENARIO_FN_RE.search(content)
         self.assertIsNotNone(scenario_fn, "scenario_single_crash_recovery function must exist")
         body = scenario_fn.group(1)
         self.assertNotIn(
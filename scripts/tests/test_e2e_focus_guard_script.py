@@ -1,15 +1,16 @@
 import unittest
-from pathlib import Path
 
+from ._fixtures import read_text
+from ._paths import E2E_DIR
 
-REPO_ROOT = Path(__file__).resolve().parents[2]
-FOCUS_GUARD_SCRIPT = REPO_ROOT / "scripts" / "e2e" / "test-focus-guard.sh"
+
+FOCUS_GUARD_SCRIPT = E2E_DIR / "test-focus-guard.sh"
 
 
 class FocusGuardScriptTests(unittest.TestCase):
     def test_meter_start_error_check_validates_specific_kind(self) -> None:
         """Regression (1b2m): must assert a method-specific error kind, not any error."""
-        content = FOCUS_GUARD_SCRIPT.read_text()
+        content = read_text(FOCUS_GUARD_SCRIPT)
         self.assertIn("E_DEVICE_NOT_FOUND", content)
         # Must NOT pass on generic or unknown error kinds
         self.assertNotIn(
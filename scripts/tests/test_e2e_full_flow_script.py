@@ -1,58 +1,83 @@
 import unittest
-from pathlib import Path
 
+from ._fixtures import ContainsAllMixin, read_text
+from ._paths import E2E_DIR
 
-REPO_ROOT = Path(__file__).resolve().parents[2]
-FULL_FLOW_SCRIPT = REPO_ROOT / "scripts" / "e2e" / "test-full-flow.sh"
 
+FULL_FLOW_SCRIPT = E2E_DIR / "test-full-flow.sh"
+
+
+class FullFlowScriptTests(ContainsAllMixin, unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.content = read_text(FULL_FLOW_SCRIPT)
 
-class FullFlowScriptTests(unittest.TestCase):
     def test_full_flow_implements_required_11_step_dictation_sequence(self) -> None:
-        content = FULL_FLOW_SCRIPT.read_text()
-
-        self.assertIn("STEPS_TOTAL=11", content)
-        self.assertIn("step_log 1", content)
-        self.assertIn("step_log 11", content)
-        self.assertIn("system.ping", content)
-        self.assertIn("asr.initialize", content)
-        self.assertIn("start_sidecar", content)
-        self.assertIn("recording.start", content)
-        self.assertIn("recording.stop", content)
-        self.assertIn("event.transcription_complete", content)
-        self.assertIn("system.shutdown", content)
+        content = self.content
+
+        self.assertContainsAll(
+            content,
+            (
+                "STEPS_TOTAL=11",
+                "step_log 1",
+                "step_log 11",
+                "system.ping",
+                "asr.initialize",
+                "start_sidecar",
+                "recording.start",
+                "recording.stop",
+                "event.transcription_complete",
+                "system.shutdown",
+            ),
+        )
 
     def test_full_flow_supports_model_unavailable_skip_and_failure_context(self) -> None:
-        content = FULL_FLOW_SCRIPT.read_text()
+        content = self.content
 
-        self.assertIn("return 77", content)
-        self.assertIn("Last 5 JSON-RPC exchanges", content)
-        self.assertIn("status.get", content)
-        self.assertIn("logs/e2e/test-full-flow-", content)
+        self.assertContainsAll(
+            content,
+            (
+                "return 77",
+                "Last 5 JSON-RPC exchanges",
+                "status.get",
+                "logs/e2e/test-full-flow-",
+            ),
+        )
 
     def test_full_flow_supports_playback_unavailable_skip(self) -> None:
-        content = FULL_FLOW_SCRIPT.read_text()
-
-        self.assertIn("Synthetic audio playback unavailable on this host", content)
-        self.assertIn("set +e", content)
-        self.assertIn("set -e", content)
-        self.assertIn('synth_output=$(generate_and_play_synthetic_audio "$SYNTH_AUDIO_FILE" 2>&1 >/dev/null)', content)
-        self.assertIn('if [[ "$synth_status" -ne 0 ]]; then', content)
-        self.assertIn('if [[ "$synth_status" -eq 2 ]] || [[ "$synth_status" -eq 3 ]]; then', content)
-        self.assertIn('sidecar_rpc_session "recording.cancel"', content)
-        self.assertIn("Skipped: recording.stop + wait transcription_complete (playback unavailable)", content)
-        self.assertIn("[RESULT] SKIPPED (exit 77)", content)
+        content = self.content
+
+        self.assertContainsAll(
+            content,
+            (
+                "Synthetic audio playback unavailable on this host",
+                "set +e",
+                "set -e",
+                'synth_output=$(generate_and_play_synthetic_audio "$SYNTH_AUDIO_FILE" 2>&1 >/dev/null)',
+                'if [[ "$synth_status" -ne 0 ]]; then',
+                'if [[ "$synth_status" -eq 2 ]] || [[ "$synth_status" -eq 3 ]]; then',
+                'sidecar_rpc_session "recording.cancel"',
+                "Skipped: recording.stop + wait transcription_complete (playback unavailable)",
+                "[RESULT] SKIPPED (exit 77)",
+            ),
+        )
         self.assertNotIn('if ! generate_and_play_synthetic_audio "$SYNTH_AUDIO_FILE" >/dev/null; then', content)
 
     def test_full_flow_supports_recording_start_unavailable_skip(self) -> None:
-        content = FULL_FLOW_SCRIPT.read_text()
-
-        self.assertIn('if echo "$start_response" | jq -e \'.error\'', content)
-        self.assertIn('[[ "$start_kind" == "E_AUDIO_IO" ]]', content)
-        self.assertIn('[[ "$start_kind" == "E_DEVICE_NOT_FOUND" ]]', content)
-        self.assertIn('[[ "$start_kind" == "E_DEVICE_UNAVAILABLE" ]]', content)
-        self.assertIn("recording.start unavailable on host audio stack", content)
-        self.assertIn("Skipped: synthetic audio playback (recording unavailable)", content)
-        self.assertIn("recording.start returned non-skip error kind", content)
+        content = self.content
+
+        self.assertContainsAll(
+            content,
+            (
+                'if echo "$start_response" | jq -e \'.error\'',
+                '[[ "$start_kind" == "E_AUDIO_IO" ]]',
+                '[[ "$start_kind" == "E_DEVICE_NOT_FOUND" ]]',
+                '[[ "$start_kind" == "E_DEVICE_UNAVAILABLE" ]]',
+                "recording.start unavailable on host audio stack",
+                "Skipped: synthetic audio playback (recording unavailable)",
+                "recording.start returned non-skip error kind",
+            ),
+        )
 
 
 if __name__ == "__main__":
@@ -1,177 +1,243 @@
 import os
 import shutil
-import stat
 import subprocess
 import tempfile
-import textwrap
 import unittest
 from pathlib import Path
 
+from ._fixtures import ContainsAllMixin, read_bytes
+from ._paths import E2E_DIR
 
-REPO_ROOT = Path(__file__).resolve().parents[2]
-SOURCE_SCRIPT = REPO_ROOT / "scripts" / "e2e" / "test-offline-install.sh"
-SOURCE_COMMON = REPO_ROOT / "scripts" / "e2e" / "lib" / "common.sh"
-SOURCE_LOG = REPO_ROOT / "scripts" / "e2e" / "lib" / "log.sh"
 
+SOURCE_SCRIPT = E2E_DIR / "test-offline-install.sh"
+SOURCE_COMMON = E2E_DIR / "lib" / "common.sh"
+SOURCE_LOG = E2E_DIR / "lib" / "log.sh"
 
-MOCK_SIDECAR = textwrap.dedent(
-    """\
-    #!/usr/bin/env python3
-    import json
-    import os
-    import shutil
-    import sys
-    import urllib.error
-    import urllib.request
-    from pathlib import Path
 
+MOCK_SIDECAR = """\
+#!/usr/bin/env python3
+import json
+import os
+import shutil
+import sys
+import urllib.error
+import urllib.request
+from functools import lru_cache
+from pathlib import Path
 
-    def cache_root() -> Path:
-        base = Path(os.environ.get("XDG_CACHE_HOME", str(Path.home() / ".cache")))
-        return base / "openvoicy" / "models"
+try:
+    import orjson
 
+    dumps = orjson.dumps
+    loads = orjson.loads
+except ImportError:
+    def dumps(value: object) -> bytes:
+        return json.dumps(value).encode("utf-8")
 
-    def manifest_path() -> Path:
-        shared_root = os.environ.get("OPENVOICY_SHARED_ROOT")
-        if not shared_root:
-            raise RuntimeError("OPENVOICY_SHARED_ROOT is required for mock sidecar")
-        return Path(shared_root) / "model" / "MODEL_MANIFEST.json"
+    loads = json.loads
 
+# Responses share a fixed prefix; only the id and body are serialized per call.
+ENVELOPE = b'{"jsonrpc":"2.0","id":'
 
-    def load_manifest() -> dict:
-        with manifest_path().open("r", encoding="utf-8") as f:
-            return json.load(f)
 
+def cache_root() -> Path:
+    base = Path(os.environ.get("XDG_CACHE_HOME", str(Path.home() / ".cache")))
+    return base / "openvoicy" / "models"
 
-    def model_cached(manifest: dict) -> bool:
-        root = cache_root() / manifest["model_id"]
-        for file_info in manifest.get("files", []):
-            if not (root / file_info["path"]).is_file():
-                return False
-        return (root / "manifest.json").is_file()
 
+def manifest_path() -> Path:
+    shared_root = os.environ.get("OPENVOICY_SHARED_ROOT")
+    if not shared_root:
+        raise RuntimeError("OPENVOICY_SHARED_ROOT is required for mock sidecar")
+    return Path(shared_root) / "model" / "MODEL_MANIFEST.json"
 
-    def write_cached_model(manifest: dict, payload: bytes) -> None:
-        root = cache_root() / manifest["model_id"]
-        root.mkdir(parents=True, exist_ok=True)
-        for file_info in manifest.get("files", []):
-            target = root / file_info["path"]
-            target.parent.mkdir(parents=True, exist_ok=True)
-            target.write_bytes(payload)
-        (root / "manifest.json").write_text(
-            json.dumps(
-                {
-                    "model_id": manifest["model_id"],
-                    "revision": manifest.get("revision", "mock"),
-                }
-            ),
-            encoding="utf-8",
-        )
 
+@lru_cache(maxsize=1)
+def load_manifest() -> dict:
+    with manifest_path().open("r", encoding="utf-8") as f:
+        return json.load(f)
 
-    def success(request_id: int, result: dict) -> None:
-        sys.stdout.write(json.dumps({"jsonrpc": "2.0", "id": request_id, "result": result}) + "\\n")
-        sys.stdout.flush()
 
+def model_cached(manifest: dict) -> bool:
+    root = cache_root() / manifest["model_id"]
+    for file_info in manifest.get("files", []):
+        if not (root / file_info["path"]).is_file():
+            return False
+    return (root / "manifest.json").is_file()
 
-    def error(request_id: int, message: str, kind: str) -> None:
-        payload = {
-            "jsonrpc": "2.0",
-            "id": request_id,
-            "error": {"code": -32000, "message": message, "data": {"kind": kind}},
-        }
-        sys.stdout.write(json.dumps(payload) + "\\n")
-        sys.stdout.flush()
-
-
-    def purge(model_id: str | None) -> list[str]:
-        root = cache_root()
-        if not root.exists():
-            return []
-        if model_id:
-            target = root / model_id
-            if target.exists():
-                shutil.rmtree(target)
-                return [model_id]
-            return []
-        purged: list[str] = []
-        for child in root.iterdir():
-            if child.is_dir():
-                purged.append(child.name)
-                shutil.rmtree(child)
-        return purged
-
-
-    for raw in sys.stdin:
-        line = raw.strip()
-        if not line:
-            continue
-        request = json.loads(line)
-        request_id = request.get("id")
-        method = request.get("method", "")
-        params = request.get("params") or {}
-
-        if method == "system.ping":
-            success(request_id, {"protocol": "v1"})
-            continue
-
-        if method == "status.get":
-            success(request_id, {"state": "idle", "model": {"status": "unknown"}})
-            continue
-
-        if method == "asr.initialize":
-            manifest = load_manifest()
-            if model_cached(manifest):
-                success(request_id, {"status": "ready", "model_id": manifest["model_id"]})
-            else:
-                error(request_id, "Model not ready", "E_MODEL_NOT_READY")
-            continue
-
-        if method == "model.purge_cache":
-            purged_ids = purge(params.get("model_id"))
-            success(request_id, {"purged": True, "purged_model_ids": purged_ids})
-            continue
-
-        if method == "model.download":
-            manifest = load_manifest()
-            url = manifest["source_url"]
-            try:
-                with urllib.request.urlopen(url, timeout=2) as response:
-                    data = response.read()
-                write_cached_model(manifest, data)
-                success(request_id, {"status": "ready", "model_id": manifest["model_id"]})
-            except (urllib.error.URLError, TimeoutError, OSError):
-                kind = os.environ.get("MOCK_DOWNLOAD_ERROR_KIND", "E_NETWORK")
-                message = os.environ.get(
-                    "MOCK_DOWNLOAD_ERROR_MESSAGE",
-                    "Check your internet connection and retry",
-                )
-                error(request_id, message, kind)
-            continue
-
-        if method == "system.shutdown":
-            success(request_id, {"ok": True})
-            break
-
-        error(request_id, f"unknown method: {method}", "E_INVALID_PARAMS")
-    """
+
+def write_cached_model(manifest: dict, payload: bytes) -> None:
+    root = cache_root() / manifest["model_id"]
+    root.mkdir(parents=True, exist_ok=True)
+    for file_info in manifest.get("files", []):
+        target = root / file_info["path"]
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_bytes(payload)
+    (root / "manifest.json").write_text(
+        json.dumps(
+            {
+                "model_id": manifest["model_id"],
+                "revision": manifest.get("revision", "mock"),
+            }
+        ),
+        encoding="utf-8",
+    )
+
+
+def respond(request_id: int, member: bytes, body: dict) -> None:
+    sys.stdout.buffer.write(ENVELOPE + dumps(request_id) + member + dumps(body) + b"}\\n")
+    sys.stdout.buffer.flush()
+
+
+def success(request_id: int, result: dict) -> None:
+    respond(request_id, b',"result":', result)
+
+
+def error(request_id: int, message: str, kind: str) -> None:
+    respond(
+        request_id,
+        b',"error":',
+        {"code": -32000, "message": message, "data": {"kind": kind}},
+    )
+
+
+def purge(model_id: str | None) -> list[str]:
+    root = cache_root()
+    if not root.exists():
+        return []
+    if model_id:
+        target = root / model_id
+        if target.exists():
+            shutil.rmtree(target)
+            return [model_id]
+        return []
+    purged: list[str] = []
+    for child in root.iterdir():
+        if child.is_dir():
+            purged.append(child.name)
+            shutil.rmtree(child)
+    return purged
+
+
+stdin = sys.stdin.buffer
+while True:
+    raw = stdin.readline()
+    if not raw:
+        break
+    line = raw.strip()
+    if not line:
+        continue
+    request = loads(line)
+    request_id = request.get("id")
+    method = request.get("method", "")
+    params = request.get("params") or {}
+
+    if method == "system.ping":
+        success(request_id, {"protocol": "v1"})
+        continue
+
+    if method == "status.get":
+        success(request_id, {"state": "idle", "model": {"status": "unknown"}})
+        continue
+
+    if method == "asr.initialize":
+        manifest = load_manifest()
+        if model_cached(manifest):
+            success(request_id, {"status": "ready", "model_id": manifest["model_id"]})
+        else:
+            error(request_id, "Model not ready", "E_MODEL_NOT_READY")
+        continue
+
+    if method == "model.purge_cache":
+        purged_ids = purge(params.get("model_id"))
+        load_manifest.cache_clear()
+        success(request_id, {"purged": True, "purged_model_ids": purged_ids})
+        continue
+
+    if method == "model.download":
+        manifest = load_manifest()
+        url = manifest["source_url"]
+        try:
+            with urllib.request.urlopen(url, timeout=2) as response:
+                data = response.read()
+            write_cached_model(manifest, data)
+            success(request_id, {"status": "ready", "model_id": manifest["model_id"]})
+        except (urllib.error.URLError, TimeoutError, OSError):
+            kind = os.environ.get("MOCK_DOWNLOAD_ERROR_KIND", "E_NETWORK")
+            message = os.environ.get(
+                "MOCK_DOWNLOAD_ERROR_MESSAGE",
+                "Check your internet connection and retry",
+            )
+            error(request_id, message, kind)
+        continue
+
+    if method == "system.shutdown":
+        success(request_id, {"ok": True})
+        break
+
+    error(request_id, f"unknown method: {method}", "E_INVALID_PARAMS")
+"""
+
+
+# name, include_default_cache, extra_env, expected exit code, expected log lines
+RUNTIME_CASES: tuple[tuple[str, bool, dict[str, str], int, tuple[str, ...]], ...] = (
+    (
+        "pass_path_covers_offline_error_atomicity_retry_and_exit_zero",
+        True,
+        {},
+        0,
+        (
+            "assert_pass model.download returns E_NETWORK when offline",
+            "atomic cache state verified",
+            "assert_pass retry succeeds with network restored",
+            "[INFO] [result] PASS",
+        ),
+    ),
+    (
+        "failure_path_returns_exit_one_for_non_network_error_kind",
+        True,
+        {"MOCK_DOWNLOAD_ERROR_KIND": "E_TIMEOUT"},
+        1,
+        ("assert_fail model.download returns E_NETWORK when offline",),
+    ),
+    (
+        "skip_path_returns_77_when_default_cache_missing",
+        False,
+        {},
+        77,
+        ("[WARN] [result] SKIP",),
+    ),
 )
 
 
-class OfflineInstallRuntimeTests(unittest.TestCase):
-    def _create_temp_project(self, include_default_cache: bool) -> tuple[Path, Path]:
-        root = Path(tempfile.mkdtemp(prefix="offline-install-runtime-"))
+class OfflineInstallRuntimeTests(ContainsAllMixin, unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        # Lay out the scripts, mock sidecar and manifest once; each test runs
+        # against its own copy of this tree.
+        template_dir = tempfile.TemporaryDirectory()
+        cls.addClassCleanup(template_dir.cleanup)
+        template_base = Path(template_dir.name)
+        cls.template_root = template_base / "project"
+        cls._write_project_tree(cls.template_root)
+        # The mock sidecar is never modified, so every project symlinks this one copy.
+        cls.mock_sidecar = template_base / "openvoicy-sidecar"
+        cls.mock_sidecar.write_text(MOCK_SIDECAR, encoding="utf-8")
+        os.chmod(cls.mock_sidecar, 0o755)
+        cls.base_env = {
+            key: value for key, value in os.environ.items() if key != "OPENVOICY_SHARED_ROOT"
+        }
+
+    @staticmethod
+    def _write_project_tree(root: Path) -> None:
         (root / "scripts" / "e2e" / "lib").mkdir(parents=True, exist_ok=True)
         (root / "sidecar" / "dist").mkdir(parents=True, exist_ok=True)
         (root / "shared" / "model").mkdir(parents=True, exist_ok=True)
 
-        shutil.copy2(SOURCE_SCRIPT, root / "scripts" / "e2e" / "test-offline-install.sh")
-        shutil.copy2(SOURCE_COMMON, root / "scripts" / "e2e" / "lib" / "common.sh")
-        shutil.copy2(SOURCE_LOG, root / "scripts" / "e2e" / "lib" / "log.sh")
-
-        sidecar_bin = root / "sidecar" / "dist" / "openvoicy-sidecar"
-        sidecar_bin.write_text(MOCK_SIDECAR, encoding="utf-8")
-        sidecar_bin.chmod(sidecar_bin.stat().st_mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
+        e2e_dir = root / "scripts" / "e2e"
+        (e2e_dir / "test-offline-install.sh").write_bytes(read_bytes(SOURCE_SCRIPT))
+        (e2e_dir / "lib" / "common.sh").write_bytes(read_bytes(SOURCE_COMMON))
+        (e2e_dir / "lib" / "log.sh").write_bytes(read_bytes(SOURCE_LOG))
 
         (root / "shared" / "model" / "MODEL_MANIFEST.json").write_text(
             """
@@ -183,6 +249,18 @@ class OfflineInstallRuntimeTests(unittest.TestCase):
             encoding="utf-8",
         )
 
+    def _create_temp_project(self, include_default_cache: bool) -> tuple[Path, Path]:
+        root = Path(tempfile.mkdtemp(prefix="offline-install-runtime-"))
+        self.addCleanup(shutil.rmtree, root, ignore_errors=True)
+        # shutil.copy skips copy2's utime/xattr calls; nothing here needs that metadata.
+        shutil.copytree(self.template_root, root, copy_function=shutil.copy, dirs_exist_ok=True)
+        sidecar_bin = root / "sidecar" / "dist" / "openvoicy-sidecar"
+        try:
+            os.symlink(self.mock_sidecar, sidecar_bin)
+        except OSError:
+            # Windows refuses symlinks without developer mode.
+            shutil.copy2(self.mock_sidecar, sidecar_bin)
+
         cache_home = root / ".default-cache"
         if include_default_cache:
             model_dir = cache_home / "openvoicy" / "models" / "default-model"
@@ -196,14 +274,14 @@ class OfflineInstallRuntimeTests(unittest.TestCase):
         root: Path,
         cache_home: Path,
         extra_env: dict[str, str] | None = None,
-    ) -> subprocess.CompletedProcess[str]:
-        env = os.environ.copy()
-        env.pop("OPENVOICY_SHARED_ROOT", None)
-        env["HOME"] = str(root / ".home")
-        env["XDG_CACHE_HOME"] = str(cache_home)
-        env["E2E_TIMEOUT_RUNNER"] = "python3"
-        if extra_env:
-            env.update(extra_env)
+    ) -> subprocess.CompletedProcess[bytes]:
+        env = {
+            **self.base_env,
+            "HOME": str(root / ".home"),
+            "XDG_CACHE_HOME": str(cache_home),
+            "E2E_TIMEOUT_RUNNER": "python3",
+            **(extra_env or {}),
+        }
 
         script = root / "scripts" / "e2e" / "test-offline-install.sh"
         return subprocess.run(
@@ -211,67 +289,43 @@ class OfflineInstallRuntimeTests(unittest.TestCase):
             cwd=root,
             env=env,
             capture_output=True,
-            text=True,
             timeout=120,
             check=False,
         )
 
-    def _latest_log_text(self, root: Path) -> str:
-        logs = sorted((root / "logs" / "e2e").glob("test-offline-install-*.log"))
-        self.assertTrue(logs, "expected offline-install log file to be created")
-        return logs[-1].read_text(encoding="utf-8")
-
-    def test_runtime_pass_path_covers_offline_error_atomicity_retry_and_exit_zero(self) -> None:
-        root, cache_home = self._create_temp_project(include_default_cache=True)
-        try:
-            completed = self._run_script(root, cache_home)
+    def _assert_exit_code(
+        self, completed: subprocess.CompletedProcess[bytes], expected: int
+    ) -> None:
+        # Output is kept as bytes and only decoded for the failure message.
+        if completed.returncode != expected:
+            stdout = completed.stdout.decode("utf-8", errors="replace")
+            stderr = completed.stderr.decode("utf-8", errors="replace")
             self.assertEqual(
                 completed.returncode,
-                0,
-                msg=f"stdout={completed.stdout}\\nstderr={completed.stderr}",
+                expected,
+                msg=f"stdout={stdout}\\nstderr={stderr}",
             )
 
-            log_text = self._latest_log_text(root)
-            self.assertIn("assert_pass model.download returns E_NETWORK when offline", log_text)
-            self.assertIn("atomic cache state verified", log_text)
-            self.assertIn("assert_pass retry succeeds with network restored", log_text)
-            self.assertIn("[INFO] [result] PASS", log_text)
-        finally:
-            shutil.rmtree(root, ignore_errors=True)
-
-    def test_runtime_failure_path_returns_exit_one_for_non_network_error_kind(self) -> None:
-        root, cache_home = self._create_temp_project(include_default_cache=True)
-        try:
-            completed = self._run_script(
-                root,
-                cache_home,
-                extra_env={"MOCK_DOWNLOAD_ERROR_KIND": "E_TIMEOUT"},
-            )
-            self.assertEqual(
-                completed.returncode,
-                1,
-                msg=f"stdout={completed.stdout}\\nstderr={completed.stderr}",
-            )
-
-            log_text = self._latest_log_text(root)
-            self.assertIn("assert_fail model.download returns E_NETWORK when offline", log_text)
-        finally:
-            shutil.rmtree(root, ignore_errors=True)
-
-    def test_runtime_skip_path_returns_77_when_default_cache_missing(self) -> None:
-        root, cache_home = self._create_temp_project(include_default_cache=False)
-        try:
-            completed = self._run_script(root, cache_home)
-            self.assertEqual(
-                completed.returncode,
-                77,
-                msg=f"stdout={completed.stdout}\\nstderr={completed.stderr}",
-            )
-
-            log_text = self._latest_log_text(root)
-            self.assertIn("[WARN] [result] SKIP", log_text)
-        finally:
-            shutil.rmtree(root, ignore_errors=True)
+    def _latest_log_text(self, root: Path) -> str:
+        log_dir = root / "logs" / "e2e"
+        self.assertTrue(log_dir.is_dir(), "expected offline-install log file to be created")
+        with os.scandir(log_dir) as entries:
+            logs = [
+                entry
+                for entry in entries
+                if entry.name.startswith("test-offline-install-") and entry.name.endswith(".log")
+            ]
+        self.assertTrue(logs, "expected offline-install log file to be created")
+        latest = max(logs, key=lambda entry: entry.name)
+        return Path(latest.path).read_text(encoding="utf-8")
+
+    def test_runtime_exit_paths(self) -> None:
+        for name, include_default_cache, extra_env, expected_rc, log_needles in RUNTIME_CASES:
+            with self.subTest(name):
+                root, cache_home = self._create_temp_project(include_default_cache)
+                completed = self._run_script(root, cache_home, extra_env)
+                self._assert_exit_code(completed, expected_rc)
+                self.assertContainsAll(self._latest_log_text(root), log_needles)
 
 
 if __name__ == "__main__":
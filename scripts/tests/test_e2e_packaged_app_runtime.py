@@ -1,15 +1,15 @@
 import os
 import shutil
-import stat
 import subprocess
 import tempfile
 import textwrap
 import unittest
 from pathlib import Path
 
+from ._paths import E2E_DIR
 
-REPO_ROOT = Path(__file__).resolve().parents[2]
-SOURCE_SCRIPT = REPO_ROOT / "scripts" / "e2e" / "test-packaged-app.sh"
+
+SOURCE_SCRIPT = E2E_DIR / "test-packaged-app.sh"
 
 
 MOCK_SIDECAR = textwrap.dedent(
@@ -82,18 +82,18 @@ class PackagedAppRuntimeTests(unittest.TestCase):
 
         sidecar_bin = root / "src-tauri" / "binaries" / f"openvoicy-sidecar-{self.target}"
         sidecar_bin.write_text(MOCK_SIDECAR, encoding="utf-8")
-        sidecar_bin.chmod(sidecar_bin.stat().st_mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
+        os.chmod(sidecar_bin, 0o755)
 
         (root / "src-tauri" / "target" / "release" / "bundle" / "appimage" / "mock.AppImage").write_bytes(
             b"mock-appimage"
         )
 
         shared_root = root / "src-tauri" / "binaries" / "shared"
-        (shared_root / "replacements" / "PRESETS.json").write_text("{}", encoding="utf-8")
-        (shared_root / "model" / "MODEL_MANIFEST.json").write_text("{}", encoding="utf-8")
-        (shared_root / "model" / "MODEL_CATALOG.json").write_text("{}", encoding="utf-8")
-        (shared_root / "model" / "manifests" / "fixture.json").write_text("{}", encoding="utf-8")
-        (shared_root / "contracts" / "tauri.events.v1.json").write_text("{}", encoding="utf-8")
+        (shared_root / "replacements" / "PRESETS.json").write_bytes(b"{}")
+        (shared_root / "model" / "MODEL_MANIFEST.json").write_bytes(b"{}")
+        (shared_root / "model" / "MODEL_CATALOG.json").write_bytes(b"{}")
+        (shared_root / "model" / "manifests" / "fixture.json").write_bytes(b"{}")
+        (shared_root / "contracts" / "tauri.events.v1.json").write_bytes(b"{}")
 
         (root / "sidecar" / "src" / "openvoicy_sidecar" / "__init__.py").write_text("", encoding="utf-8")
         (root / "sidecar" / "src" / "openvoicy_sidecar" / "self_test.py").write_text(
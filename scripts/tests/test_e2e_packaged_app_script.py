@@ -1,31 +1,39 @@
 import unittest
-from pathlib import Path
 
+from ._fixtures import ContainsAllMixin, read_text
+from ._paths import E2E_DIR
 
-REPO_ROOT = Path(__file__).resolve().parents[2]
-SCRIPT = REPO_ROOT / "scripts" / "e2e" / "test-packaged-app.sh"
 
+SCRIPT = E2E_DIR / "test-packaged-app.sh"
+
+
+class PackagedAppScriptTests(ContainsAllMixin, unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.content = read_text(SCRIPT)
 
-class PackagedAppScriptTests(unittest.TestCase):
     def test_packaged_app_script_checks_resources_and_system_info_paths(self) -> None:
-        content = SCRIPT.read_text()
-
-        self.assertIn("src-tauri/target/release/bundle", content)
-        self.assertIn("find_bundle_artifact()", content)
-        self.assertIn("bundle_artifact=", content)
-        self.assertIn("Missing packaged app bundle output directory", content)
-        self.assertIn("detect_timeout_runner()", content)
-        self.assertIn("run_with_timeout()", content)
-        self.assertIn('run_with_timeout 10 "$SIDECAR_BIN"', content)
-        self.assertNotIn('| timeout 10 "$SIDECAR_BIN"', content)
-        self.assertIn("OPENVOICY_SHARED_ROOT", content)
-        self.assertIn("OPENVOICY_SIDECAR_COMMAND", content)
-        self.assertIn("python3 -m openvoicy_sidecar.self_test", content)
-        self.assertIn('"system.info"', content)
-        self.assertIn('"resource_paths"', content)
-        self.assertIn("MODEL_MANIFEST.json", content)
-        self.assertIn("PRESETS.json", content)
-        self.assertIn("system.info resource path validation: OK", content)
+        self.assertContainsAll(
+            self.content,
+            (
+                "src-tauri/target/release/bundle",
+                "find_bundle_artifact()",
+                "bundle_artifact=",
+                "Missing packaged app bundle output directory",
+                "detect_timeout_runner()",
+                "run_with_timeout()",
+                'run_with_timeout 10 "$SIDECAR_BIN"',
+                "OPENVOICY_SHARED_ROOT",
+                "OPENVOICY_SIDECAR_COMMAND",
+                "python3 -m openvoicy_sidecar.self_test",
+                '"system.info"',
+                '"resource_paths"',
+                "MODEL_MANIFEST.json",
+                "PRESETS.json",
+                "system.info resource path validation: OK",
+            ),
+        )
+        self.assertNotIn('| timeout 10 "$SIDECAR_BIN"', self.content)
 
 
 if __name__ == "__main__":
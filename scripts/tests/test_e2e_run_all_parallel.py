@@ -4,14 +4,16 @@ import tempfile
 import unittest
 from pathlib import Path
 
+from ._fixtures import read_text, scratch_dir
+from ._paths import E2E_DIR
 
-REPO_ROOT = Path(__file__).resolve().parents[2]
-RUN_ALL_SRC = REPO_ROOT / "scripts" / "e2e" / "run-all.sh"
+
+RUN_ALL_SRC = E2E_DIR / "run-all.sh"
 
 
 class E2ERunAllParallelTests(unittest.TestCase):
     def test_parallel_mode_does_not_use_local_outside_function(self) -> None:
-        with tempfile.TemporaryDirectory() as tmpdir:
+        with tempfile.TemporaryDirectory(dir=scratch_dir()) as tmpdir:
             tmp = Path(tmpdir)
             e2e_dir = tmp / "scripts" / "e2e"
             lib_dir = e2e_dir / "lib"
@@ -45,7 +47,7 @@ class E2ERunAllParallelTests(unittest.TestCase):
 
 class E2ERunAllContractTests(unittest.TestCase):
     def test_run_all_includes_required_ordered_suite_and_summary_contract(self) -> None:
-        content = RUN_ALL_SRC.read_text()
+        content = read_text(RUN_ALL_SRC)
 
         self.assertIn("Test ${ordinal}/${total}: ${label}", content)
         self.assertIn("Environment checks", content)
@@ -60,7 +62,7 @@ class E2ERunAllContractTests(unittest.TestCase):
         self.assertIn("PASSED, ${TESTS_SKIPPED} SKIPPED, ${TESTS_FAILED} FAILED", content)
 
     def test_run_all_logs_with_timestamp_and_run_log_file(self) -> None:
-        content = RUN_ALL_SRC.read_text()
+        content = read_text(RUN_ALL_SRC)
 
         self.assertIn('RUN_LOG_FILE="$PROJECT_ROOT/logs/e2e/run-', content)
         self.assertIn('date -u +%Y-%m-%d-%H%M%S', content)
@@ -1,42 +1,62 @@
 import unittest
-from pathlib import Path
 
+from ._fixtures import ContainsAllMixin, read_text
+from ._paths import E2E_DIR
 
-REPO_ROOT = Path(__file__).resolve().parents[2]
-RUN_ALL_SCRIPT = REPO_ROOT / "scripts" / "e2e" / "run-all.sh"
 
+RUN_ALL_SCRIPT = E2E_DIR / "run-all.sh"
 
-class E2ERunAllScriptTests(unittest.TestCase):
-    def test_run_all_declares_required_seven_stage_orchestrator(self) -> None:
-        content = RUN_ALL_SCRIPT.read_text()
 
-        self.assertIn('if matches_filter "environment" "Environment checks"; then', content)
-        self.assertIn('if matches_filter "startup-health" "Sidecar startup health"; then', content)
-        self.assertIn('if matches_filter "ipc-compliance" "IPC compliance self-test"; then', content)
-        self.assertIn('if matches_filter "crash-loop-recovery" "Sidecar crash loop recovery"; then', content)
-        self.assertIn('if matches_filter "full-dictation-flow" "Full dictation flow"; then', content)
-        self.assertIn('if matches_filter "device-removal" "Device removal mid-recording"; then', content)
-        self.assertIn('if matches_filter "offline-install" "Offline install behavior"; then', content)
-        self.assertIn('run_step "$ordinal" "$total" "${ids[$idx]}" "${labels[$idx]}" ${handlers[$idx]}', content)
+class E2ERunAllScriptTests(ContainsAllMixin, unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.content = read_text(RUN_ALL_SCRIPT)
 
-    def test_run_all_invokes_expected_scripts_and_ipc_self_test(self) -> None:
-        content = RUN_ALL_SCRIPT.read_text()
+    def test_run_all_declares_required_seven_stage_orchestrator(self) -> None:
+        content = self.content
+
+        self.assertContainsAll(
+            content,
+            (
+                'if matches_filter "environment" "Environment checks"; then',
+                'if matches_filter "startup-health" "Sidecar startup health"; then',
+                'if matches_filter "ipc-compliance" "IPC compliance self-test"; then',
+                'if matches_filter "crash-loop-recovery" "Sidecar crash loop recovery"; then',
+                'if matches_filter "full-dictation-flow" "Full dictation flow"; then',
+                'if matches_filter "device-removal" "Device removal mid-recording"; then',
+                'if matches_filter "offline-install" "Offline install behavior"; then',
+                'run_step "$ordinal" "$total" "${ids[$idx]}" "${labels[$idx]}" ${handlers[$idx]}',
+            ),
+        )
 
-        self.assertIn("run_logged_command startup-health bash $SCRIPT_DIR/test-startup-health.sh", content)
-        self.assertIn("run_logged_command crash-loop-recovery bash $SCRIPT_DIR/test-error-recovery.sh", content)
-        self.assertIn("run_logged_command full-dictation-flow bash $SCRIPT_DIR/test-full-flow.sh", content)
-        self.assertIn("run_logged_command device-removal bash $SCRIPT_DIR/test-device-removal.sh", content)
-        self.assertIn("run_logged_command offline-install bash $SCRIPT_DIR/test-offline-install.sh", content)
-        self.assertIn("run_logged_command ipc-compliance python3 -m openvoicy_sidecar.self_test", content)
+    def test_run_all_invokes_expected_scripts_and_ipc_self_test(self) -> None:
+        content = self.content
+
+        self.assertContainsAll(
+            content,
+            (
+                "run_logged_command startup-health bash $SCRIPT_DIR/test-startup-health.sh",
+                "run_logged_command crash-loop-recovery bash $SCRIPT_DIR/test-error-recovery.sh",
+                "run_logged_command full-dictation-flow bash $SCRIPT_DIR/test-full-flow.sh",
+                "run_logged_command device-removal bash $SCRIPT_DIR/test-device-removal.sh",
+                "run_logged_command offline-install bash $SCRIPT_DIR/test-offline-install.sh",
+                "run_logged_command ipc-compliance python3 -m openvoicy_sidecar.self_test",
+            ),
+        )
 
     def test_run_all_logs_summary_and_exit_contract(self) -> None:
-        content = RUN_ALL_SCRIPT.read_text()
-
-        self.assertIn("logs/e2e/run-", content)
-        self.assertIn("E2E TEST SUMMARY", content)
-        self.assertIn("if [[ \"$TESTS_FAILED\" -gt 0 ]]; then", content)
-        self.assertIn("exit 1", content)
-        self.assertIn("exit 0", content)
+        content = self.content
+
+        self.assertContainsAll(
+            content,
+            (
+                "logs/e2e/run-",
+                "E2E TEST SUMMARY",
+                "if [[ \"$TESTS_FAILED\" -gt 0 ]]; then",
+                "exit 1",
+                "exit 0",
+            ),
+        )
 
 
 if __name__ == "__main__":
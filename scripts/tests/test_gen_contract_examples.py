@@ -1,54 +1,45 @@
-import importlib.util
 import tempfile
 import unittest
 from pathlib import Path
 
+from ._fixtures import load_script_module
+from ._paths import SCRIPTS
 
-SCRIPT_PATH = Path(__file__).resolve().parents[1] / "gen_contract_examples.py"
-SPEC = importlib.util.spec_from_file_location("gen_contract_examples", SCRIPT_PATH)
-MODULE = importlib.util.module_from_spec(SPEC)
-assert SPEC and SPEC.loader
-SPEC.loader.exec_module(MODULE)
+
+SCRIPT_PATH = SCRIPTS / "gen_contract_examples.py"
+MODULE = load_script_module("gen_contract_examples", SCRIPT_PATH)
+
+CANONICAL_JSONL_BYTES = b'{"type":"request","data":{"method":"status.get"}}\n'
+DRIFTED_JSONL_BYTES = b'{"type":"request","data":{"method":"status.get_typo"}}\n'
 
 
 class GenerateContractExamplesTests(unittest.TestCase):
-    def test_generate_creates_derived_copy_from_canonical(self) -> None:
-        with tempfile.TemporaryDirectory() as tmpdir:
-            root = Path(tmpdir)
-            canonical = root / "shared" / "ipc" / "examples" / "IPC_V1_EXAMPLES.jsonl"
-            canonical.parent.mkdir(parents=True, exist_ok=True)
-            canonical.write_text('{"type":"request","data":{"method":"status.get"}}\n', encoding="utf-8")
+    def setUp(self) -> None:
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.root = Path(tmpdir.name)
+        self.canonical = self.root / "shared" / "ipc" / "examples" / "IPC_V1_EXAMPLES.jsonl"
+        self.canonical.parent.mkdir(parents=True)
+        self.canonical.write_bytes(CANONICAL_JSONL_BYTES)
+        self.derived = self.root / "shared" / "contracts" / "examples" / "IPC_V1_EXAMPLES.jsonl"
 
-            result = MODULE.generate(root)
-            self.assertEqual(result, 0)
+    def test_generate_creates_derived_copy_from_canonical(self) -> None:
+        result = MODULE.generate(self.root)
+        self.assertEqual(result, 0)
 
-            derived = root / "shared" / "contracts" / "examples" / "IPC_V1_EXAMPLES.jsonl"
-            self.assertTrue(derived.exists())
-            self.assertEqual(derived.read_text(encoding="utf-8"), canonical.read_text(encoding="utf-8"))
+        self.assertTrue(self.derived.exists())
+        self.assertEqual(self.derived.read_bytes(), CANONICAL_JSONL_BYTES)
 
     def test_check_skips_when_derived_directory_absent(self) -> None:
-        with tempfile.TemporaryDirectory() as tmpdir:
-            root = Path(tmpdir)
-            canonical = root / "shared" / "ipc" / "examples" / "IPC_V1_EXAMPLES.jsonl"
-            canonical.parent.mkdir(parents=True, exist_ok=True)
-            canonical.write_text('{"type":"request","data":{"method":"status.get"}}\n', encoding="utf-8")
-
-            result = MODULE.check(root)
-            self.assertEqual(result, 0)
+        result = MODULE.check(self.root)
+        self.assertEqual(result, 0)
 
     def test_check_fails_when_derived_fixture_drifted(self) -> None:
-        with tempfile.TemporaryDirectory() as tmpdir:
-            root = Path(tmpdir)
-            canonical = root / "shared" / "ipc" / "examples" / "IPC_V1_EXAMPLES.jsonl"
-            canonical.parent.mkdir(parents=True, exist_ok=True)
-            canonical.write_text('{"type":"request","data":{"method":"status.get"}}\n', encoding="utf-8")
-
-            derived = root / "shared" / "contracts" / "examples" / "IPC_V1_EXAMPLES.jsonl"
-            derived.parent.mkdir(parents=True, exist_ok=True)
-            derived.write_text('{"type":"request","data":{"method":"status.get_typo"}}\n', encoding="utf-8")
-
-            result = MODULE.check(root)
-            self.assertEqual(result, 1)
+        self.derived.parent.mkdir(parents=True)
+        self.derived.write_bytes(DRIFTED_JSONL_BYTES)
+
+        result = MODULE.check(self.root)
+        self.assertEqual(result, 1)
 
 
 if __name__ == "__main__":
@@ -1,69 +1,64 @@
-import importlib.util
-import sys
+import os
 import tempfile
 import unittest
 from pathlib import Path
 
+from ._fixtures import ContainsAllMixin, load_script_module
+from ._paths import REPO_ROOT, SCRIPTS
 
-SCRIPT_PATH = Path(__file__).resolve().parents[1] / "gen_contracts_rs.py"
-SPEC = importlib.util.spec_from_file_location("gen_contracts_rs", SCRIPT_PATH)
-MODULE = importlib.util.module_from_spec(SPEC)
-assert SPEC and SPEC.loader
-sys.modules[SPEC.name] = MODULE
-SPEC.loader.exec_module(MODULE)
 
+SCRIPT_PATH = SCRIPTS / "gen_contracts_rs.py"
+MODULE = load_script_module("gen_contracts_rs", SCRIPT_PATH)
 
-class GenContractsRsTests(unittest.TestCase):
+
+class GenContractsRsTests(ContainsAllMixin, unittest.TestCase):
     @classmethod
     def setUpClass(cls) -> None:
-        cls.repo_root = Path(__file__).resolve().parents[2]
+        cls.repo_root = REPO_ROOT
+        with tempfile.TemporaryDirectory() as tmpdir:
+            out_path = Path(tmpdir) / "contracts.rs"
+            cls.exit_code = MODULE.main(["--repo-root", str(cls.repo_root), "--out", str(out_path)])
+            cls.output = out_path.read_bytes()
 
     def test_main_generates_deterministic_output(self) -> None:
+        # The class-level run is the first generation; one fresh run must match it.
         with tempfile.TemporaryDirectory() as tmpdir:
             out_path = Path(tmpdir) / "contracts.rs"
-            args = ["--repo-root", str(self.repo_root), "--out", str(out_path)]
-
-            first_exit = MODULE.main(args)
-            first = out_path.read_text(encoding="utf-8")
-
-            second_exit = MODULE.main(args)
-            second = out_path.read_text(encoding="utf-8")
+            second_exit = MODULE.main(["--repo-root", str(self.repo_root), "--out", str(out_path)])
+            second = out_path.read_bytes()
 
-            self.assertEqual(first_exit, 0)
-            self.assertEqual(second_exit, 0)
-            self.assertEqual(first, second)
+        self.assertEqual(self.exit_code, 0)
+        self.assertEqual(second_exit, 0)
+        self.assertEqual(self.output, second)
 
     def test_output_contains_required_constants_and_types(self) -> None:
-        with tempfile.TemporaryDirectory() as tmpdir:
-            out_path = Path(tmpdir) / "contracts.rs"
-            MODULE.main(["--repo-root", str(self.repo_root), "--out", str(out_path)])
-            output = out_path.read_text(encoding="utf-8")
+        output = self.output
 
-            required_snippets = [
-                "pub const CMD_GET_APP_STATE: &str = \"get_app_state\";",
-                "pub const EVENT_STATE_CHANGED: &str = \"state:changed\";",
-                "pub const EVENT_STATE_CHANGED_LEGACY: &str = \"state_changed\";",
-                "pub const RPC_STATUS_GET: &str = \"status.get\";",
-                "pub const RPC_NOTIFY_EVENT_STATUS_CHANGED: &str = \"event.status_changed\";",
-                "pub type EventStateChangedPayload = ",
-                "pub struct RpcStatusGetParams",
-                "pub struct RpcStatusGetResult",
-                "pub struct RpcNotificationEventStatusChangedParams",
-            ]
+        required_snippets = [
+            b"pub const CMD_GET_APP_STATE: &str = \"get_app_state\";",
+            b"pub const EVENT_STATE_CHANGED: &str = \"state:changed\";",
+            b"pub const EVENT_STATE_CHANGED_LEGACY: &str = \"state_changed\";",
+            b"pub const RPC_STATUS_GET: &str = \"status.get\";",
+            b"pub const RPC_NOTIFY_EVENT_STATUS_CHANGED: &str = \"event.status_changed\";",
+            b"pub type EventStateChangedPayload = ",
+            b"pub struct RpcStatusGetParams",
+            b"pub struct RpcStatusGetResult",
+            b"pub struct RpcNotificationEventStatusChangedParams",
+        ]
 
-            for snippet in required_snippets:
-                self.assertIn(snippet, output)
+        self.assertContainsAll(output, required_snippets)
 
     def test_output_omits_timestamps_and_absolute_paths(self) -> None:
-        with tempfile.TemporaryDirectory() as tmpdir:
-            out_path = Path(tmpdir) / "contracts.rs"
-            MODULE.main(["--repo-root", str(self.repo_root), "--out", str(out_path)])
-            output = out_path.read_text(encoding="utf-8")
+        output = self.output
 
-            self.assertNotIn(str(self.repo_root), output)
-            self.assertNotIn("Generated at", output)
-            self.assertIn("AUTO-GENERATED from shared/contracts/*.v1.json", output)
-            self.assertIn("Regenerate with: python scripts/gen_contracts_rs.py", output)
+        self.assertContainsNone(output, (os.fsencode(self.repo_root), b"Generated at"))
+        self.assertContainsAll(
+            output,
+            (
+                b"AUTO-GENERATED from shared/contracts/*.v1.json",
+                b"Regenerate with: python scripts/gen_contracts_rs.py",
+            ),
+        )
 
 
 if __name__ == "__main__":
@@ -1,73 +1,68 @@
-import importlib.util
-import sys
+import os
 import tempfile
 import unittest
 from pathlib import Path
 
+from ._fixtures import ContainsAllMixin, load_script_module
+from ._paths import REPO_ROOT, SCRIPTS
 
-SCRIPT_PATH = Path(__file__).resolve().parents[1] / "gen_contracts_ts.py"
-SPEC = importlib.util.spec_from_file_location("gen_contracts_ts", SCRIPT_PATH)
-MODULE = importlib.util.module_from_spec(SPEC)
-assert SPEC and SPEC.loader
-sys.modules[SPEC.name] = MODULE
-SPEC.loader.exec_module(MODULE)
 
+SCRIPT_PATH = SCRIPTS / "gen_contracts_ts.py"
+MODULE = load_script_module("gen_contracts_ts", SCRIPT_PATH)
 
-class GenContractsTsTests(unittest.TestCase):
+
+class GenContractsTsTests(ContainsAllMixin, unittest.TestCase):
     @classmethod
     def setUpClass(cls) -> None:
-        cls.repo_root = Path(__file__).resolve().parents[2]
+        cls.repo_root = REPO_ROOT
+        with tempfile.TemporaryDirectory() as tmpdir:
+            out_path = Path(tmpdir) / "types.contracts.ts"
+            cls.exit_code = MODULE.main(["--repo-root", str(cls.repo_root), "--out", str(out_path)])
+            cls.output = out_path.read_bytes()
 
     def test_main_generates_deterministic_output(self) -> None:
+        # The class-level run is the first generation; one fresh run must match it.
         with tempfile.TemporaryDirectory() as tmpdir:
             out_path = Path(tmpdir) / "types.contracts.ts"
-            args = ["--repo-root", str(self.repo_root), "--out", str(out_path)]
-
-            first_exit = MODULE.main(args)
-            first = out_path.read_text(encoding="utf-8")
-
-            second_exit = MODULE.main(args)
-            second = out_path.read_text(encoding="utf-8")
+            second_exit = MODULE.main(["--repo-root", str(self.repo_root), "--out", str(out_path)])
+            second = out_path.read_bytes()
 
-            self.assertEqual(first_exit, 0)
-            self.assertEqual(second_exit, 0)
-            self.assertEqual(first, second)
+        self.assertEqual(self.exit_code, 0)
+        self.assertEqual(second_exit, 0)
+        self.assertEqual(self.output, second)
 
     def test_output_contains_required_type_maps(self) -> None:
-        with tempfile.TemporaryDirectory() as tmpdir:
-            out_path = Path(tmpdir) / "types.contracts.ts"
-            MODULE.main(["--repo-root", str(self.repo_root), "--out", str(out_path)])
-            output = out_path.read_text(encoding="utf-8")
+        output = self.output
 
-            required_snippets = [
-                "export type TauriCommandGetAppStateParams = ",
-                "export type TauriCommandGetAppStateResult = ",
-                "export interface TauriCommandParamsMap {",
-                "export interface TauriCommandResultMap {",
-                "export type TauriEventStateChangedPayload = ",
-                "export interface TauriEventPayloadMap {",
-                "export type SidecarRpcMethodSystemPingParams = ",
-                "export type SidecarRpcMethodSystemPingResult = ",
-                "export interface SidecarRpcMethodParamsMap {",
-                "export interface SidecarRpcMethodResultMap {",
-                "export type SidecarRpcMethodModelInstallParams = ",
-                "export type SidecarRpcNotificationEventModelProgressParams = ",
-                "export interface SidecarRpcNotificationParamsMap {",
-            ]
+        required_snippets = [
+            b"export type TauriCommandGetAppStateParams = ",
+            b"export type TauriCommandGetAppStateResult = ",
+            b"export interface TauriCommandParamsMap {",
+            b"export interface TauriCommandResultMap {",
+            b"export type TauriEventStateChangedPayload = ",
+            b"export interface TauriEventPayloadMap {",
+            b"export type SidecarRpcMethodSystemPingParams = ",
+            b"export type SidecarRpcMethodSystemPingResult = ",
+            b"export interface SidecarRpcMethodParamsMap {",
+            b"export interface SidecarRpcMethodResultMap {",
+            b"export type SidecarRpcMethodModelInstallParams = ",
+            b"export type SidecarRpcNotificationEventModelProgressParams = ",
+            b"export interface SidecarRpcNotificationParamsMap {",
+        ]
 
-            for snippet in required_snippets:
-                self.assertIn(snippet, output)
+        self.assertContainsAll(output, required_snippets)
 
     def test_output_omits_timestamps_and_absolute_paths(self) -> None:
-        with tempfile.TemporaryDirectory() as tmpdir:
-            out_path = Path(tmpdir) / "types.contracts.ts"
-            MODULE.main(["--repo-root", str(self.repo_root), "--out", str(out_path)])
-            output = out_path.read_text(encoding="utf-8")
+        output = self.output
 
-            self.assertNotIn(str(self.repo_root), output)
-            self.assertNotIn("Generated at", output)
-            self.assertIn("AUTO-GENERATED FILE. DO NOT EDIT.", output)
-            self.assertIn("Regenerate with: python scripts/gen_contracts_ts.py", output)
+        self.assertContainsNone(output, (os.fsencode(self.repo_root), b"Generated at"))
+        self.assertContainsAll(
+            output,
+            (
+                b"AUTO-GENERATED FILE. DO NOT EDIT.",
+                b"Regenerate with: python scripts/gen_contracts_ts.py",
+            ),
+        )
 
 
 if __name__ == "__main__":
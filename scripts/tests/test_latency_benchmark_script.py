@@ -1,210 +1,208 @@
-import importlib.util
 import io
 import json
-import subprocess
+import shutil
 import sys
 import tempfile
 import unittest
-from contextlib import redirect_stderr, redirect_stdout
+from contextlib import ExitStack, redirect_stderr, redirect_stdout
 from pathlib import Path
 from unittest import mock
 
+from ._fixtures import ContainsAllMixin, load_script_module, read_text
+from ._paths import SCRIPTS
+
+
+BENCHMARK_SCRIPT = SCRIPTS / "benchmark" / "latency.py"
+
+latency_benchmark = load_script_module("latency_benchmark_script", BENCHMARK_SCRIPT)
+
+
+class _FakeClient:
+    def __init__(self, sidecar_bin: Path) -> None:
+        self.sidecar_bin = sidecar_bin
+
+    def start(self) -> None:
+        return None
+
+    def call(self, method: str, params: dict[str, object], timeout_s: float) -> dict[str, str]:
+        return {"protocol": "v1", "server": "mock"}
+
+    def stop(self) -> None:
+        return None
+
+
+def _make_fake_run_iteration(
+    *,
+    base_measured_ms: int,
+    ipc_ms: int,
+    transcribe_ms: int,
+    postprocess_ms: int,
+    text_preview: str,
+):
+    def fake_run_iteration(
+        client: object,
+        temp_dir: Path,
+        index: int,
+        duration_s: float,
+        inject_budget_ms: int,
+        playback_required: bool,
+    ) -> latency_benchmark.RunTimings:
+        measured_ms = base_measured_ms + index
+        return latency_benchmark.RunTimings(
+            index=index,
+            session_id=f"mock-session-{index}",
+            duration_s=duration_s,
+            ipc_ms=ipc_ms,
+            transcribe_ms=transcribe_ms,
+            postprocess_ms=postprocess_ms,
+            measured_ms=measured_ms,
+            inject_budget_ms=inject_budget_ms,
+            projected_total_ms=measured_ms + inject_budget_ms,
+            text_preview=text_preview,
+            t0_iso="2026-01-01T00:00:00+00:00",
+            t1_iso="2026-01-01T00:00:01+00:00",
+            t2_iso="2026-01-01T00:00:02+00:00",
+            t3_iso="2026-01-01T00:00:03+00:00",
+        )
 
-REPO_ROOT = Path(__file__).resolve().parents[2]
-BENCHMARK_SCRIPT = REPO_ROOT / "scripts" / "benchmark" / "latency.py"
+    return fake_run_iteration
 
-_LATENCY_SPEC = importlib.util.spec_from_file_location(
-    "latency_benchmark_script", BENCHMARK_SCRIPT
-)
-assert _LATENCY_SPEC is not None
-assert _LATENCY_SPEC.loader is not None
-latency_benchmark = importlib.util.module_from_spec(_LATENCY_SPEC)
-sys.modules[_LATENCY_SPEC.name] = latency_benchmark
-_LATENCY_SPEC.loader.exec_module(latency_benchmark)
 
+class LatencyBenchmarkScriptTests(ContainsAllMixin, unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.content = read_text(BENCHMARK_SCRIPT)
 
-class LatencyBenchmarkScriptTests(unittest.TestCase):
     def test_benchmark_script_exists_and_contains_required_latency_stages(self) -> None:
-        content = BENCHMARK_SCRIPT.read_text(encoding="utf-8")
-
-        self.assertIn("median(stop->injection) < 1200ms", content)
-        self.assertIn("Warm-up run is executed and discarded", content)
-        self.assertIn("ipc_ms", content)
-        self.assertIn("transcribe_ms", content)
-        self.assertIn("postprocess_ms", content)
-        self.assertIn("measured_ms", content)
-        self.assertIn("inject_budget_ms", content)
-        self.assertIn("projected_total_ms", content)
-        self.assertIn("return 77", content)
-        self.assertNotIn("inject_delay_ms", content)
-        self.assertNotIn("simulated host injection delay", content)
-        self.assertNotIn("time.sleep(inject", content)
-        self.assertIn("numpy unavailable; cannot synthesize benchmark waveform", content)
-        self.assertIn("except ModuleNotFoundError as exc", content)
-        self.assertIn("raise BenchmarkSkip", content)
+        self.assertContainsAll(
+            self.content,
+            (
+                "median(stop->injection) < 1200ms",
+                "Warm-up run is executed and discarded",
+                "ipc_ms",
+                "transcribe_ms",
+                "postprocess_ms",
+                "measured_ms",
+                "inject_budget_ms",
+                "projected_total_ms",
+                "return 77",
+                "numpy unavailable; cannot synthesize benchmark waveform",
+                "except ModuleNotFoundError as exc",
+                "raise BenchmarkSkip",
+            ),
+        )
+        self.assertContainsNone(
+            self.content,
+            ("inject_delay_ms", "simulated host injection delay", "time.sleep(inject"),
+        )
 
     def test_benchmark_script_cli_help(self) -> None:
-        result = subprocess.run(
-            ["python3", str(BENCHMARK_SCRIPT), "--help"],
-            cwd=REPO_ROOT,
-            check=False,
-            capture_output=True,
-            text=True,
+        stdout = io.StringIO()
+        with redirect_stdout(stdout), self.assertRaises(SystemExit) as ctx:
+            latency_benchmark.parse_args(["--help"])
+        self.assertEqual(ctx.exception.code, 0)
+        help_text = stdout.getvalue()
+        self.assertContainsAll(
+            help_text,
+            ("--runs", "--target-ms", "--strict", "--json-out", "--inject-budget-ms"),
         )
-        self.assertEqual(result.returncode, 0, msg=result.stderr)
-        self.assertIn("--runs", result.stdout)
-        self.assertIn("--target-ms", result.stdout)
-        self.assertIn("--strict", result.stdout)
-        self.assertIn("--json-out", result.stdout)
-        self.assertNotIn("--inject-delay-ms", result.stdout)
-        self.assertIn("--inject-budget-ms", result.stdout)
+        self.assertNotIn("--inject-delay-ms", help_text)
 
     def test_run_iteration_skips_when_numpy_missing_for_audio_generation(self) -> None:
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            with mock.patch.object(
-                latency_benchmark,
-                "generate_sine_wav",
-                side_effect=latency_benchmark.BenchmarkSkip(
-                    "numpy unavailable; cannot synthesize benchmark waveform"
-                ),
-            ):
-                with self.assertRaises(latency_benchmark.BenchmarkSkip) as ctx:
-                    latency_benchmark.run_iteration(
-                        client=object(),  # Not used before generation failure.
-                        temp_dir=Path(tmp_dir),
-                        index=1,
-                        duration_s=1.0,
-                        inject_budget_ms=50,
-                        playback_required=True,
-                    )
+        tmp_dir = self._make_tmp_dir()
+        with mock.patch.object(
+            latency_benchmark,
+            "generate_sine_wav",
+            side_effect=latency_benchmark.BenchmarkSkip(
+                "numpy unavailable; cannot synthesize benchmark waveform"
+            ),
+        ):
+            with self.assertRaises(latency_benchmark.BenchmarkSkip) as ctx:
+                latency_benchmark.run_iteration(
+                    client=object(),  # Not used before generation failure.
+                    temp_dir=tmp_dir,
+                    index=1,
+                    duration_s=1.0,
+                    inject_budget_ms=50,
+                    playback_required=True,
+                )
         self.assertIn("numpy unavailable", str(ctx.exception))
 
-    def test_main_writes_runtime_json_report_contract(self) -> None:
-        class FakeClient:
-            def __init__(self, sidecar_bin: Path) -> None:
-                self.sidecar_bin = sidecar_bin
-
-            def start(self) -> None:
-                return None
-
-            def call(self, method: str, params: dict[str, object], timeout_s: float) -> dict[str, str]:
-                self._last_call = (method, params, timeout_s)
-                return {"protocol": "v1", "server": "mock"}
-
-            def stop(self) -> None:
-                return None
-
-        def fake_run_iteration(
-            client: object,
-            temp_dir: Path,
-            index: int,
-            duration_s: float,
-            inject_budget_ms: int,
-            playback_required: bool,
-        ) -> latency_benchmark.RunTimings:
-            measured_ms = 300 + index
-            return latency_benchmark.RunTimings(
-                index=index,
-                session_id=f"mock-session-{index}",
-                duration_s=duration_s,
-                ipc_ms=80,
-                transcribe_ms=180,
-                postprocess_ms=40,
-                measured_ms=measured_ms,
-                inject_budget_ms=inject_budget_ms,
-                projected_total_ms=measured_ms + inject_budget_ms,
-                text_preview="mock transcript",
-                t0_iso="2026-01-01T00:00:00+00:00",
-                t1_iso="2026-01-01T00:00:01+00:00",
-                t2_iso="2026-01-01T00:00:02+00:00",
-                t3_iso="2026-01-01T00:00:03+00:00",
-            )
-
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            report_path = Path(tmp_dir) / "latency-report.json"
-            stdout = io.StringIO()
-            stderr = io.StringIO()
-
-            argv = [
-                "latency.py",
-                "--runs",
-                "3",
-                "--target-ms",
-                "1200",
-                "--inject-budget-ms",
-                "50",
-                "--json-out",
-                str(report_path),
-                "--no-playback-required",
-            ]
-
-            with mock.patch.object(sys, "argv", argv):
-                with mock.patch.object(latency_benchmark, "SidecarClient", FakeClient):
-                    with mock.patch.object(latency_benchmark, "ensure_model_available"):
-                        with mock.patch.object(latency_benchmark, "initialize_model"):
-                            with mock.patch.object(latency_benchmark, "run_iteration", side_effect=fake_run_iteration):
-                                with redirect_stdout(stdout), redirect_stderr(stderr):
-                                    rc = latency_benchmark.main()
-
-            self.assertEqual(rc, 0, msg=stderr.getvalue())
-            self.assertTrue(report_path.is_file())
-
-            report = json.loads(report_path.read_text(encoding="utf-8"))
-            self.assertIn("generated_at", report)
-            self.assertIn("summary", report)
-            self.assertIn("runs", report)
-            self.assertEqual(len(report["runs"]), 3)
-            self.assertEqual(report["summary"]["count"], 3)
-            self.assertEqual(report["summary"]["inject_budget_ms"], 50)
-            self.assertIn("projected_median_ms", report["summary"])
-            self.assertIn("median_breakdown_ms", report["summary"])
-            self.assertIn("ipc", report["summary"]["median_breakdown_ms"])
-            self.assertIn("transcribe", report["summary"]["median_breakdown_ms"])
-            self.assertIn("postprocess", report["summary"]["median_breakdown_ms"])
-            self.assertIn("Latency benchmark (3 runs, after model warm):", stdout.getvalue())
+    def _make_tmp_dir(self) -> Path:
+        tmp_dir = Path(tempfile.mkdtemp(prefix="latency-test-"))
+        self.addCleanup(shutil.rmtree, tmp_dir, ignore_errors=True)
+        return tmp_dir
 
-    def test_main_returns_ci_informational_success_when_threshold_exceeded(self) -> None:
-        class FakeClient:
-            def __init__(self, sidecar_bin: Path) -> None:
-                self.sidecar_bin = sidecar_bin
-
-            def start(self) -> None:
-                return None
-
-            def call(self, method: str, params: dict[str, object], timeout_s: float) -> dict[str, str]:
-                return {"protocol": "v1", "server": "mock"}
-
-            def stop(self) -> None:
-                return None
-
-        def slow_run_iteration(
-            client: object,
-            temp_dir: Path,
-            index: int,
-            duration_s: float,
-            inject_budget_ms: int,
-            playback_required: bool,
-        ) -> latency_benchmark.RunTimings:
-            measured_ms = 2000 + index
-            return latency_benchmark.RunTimings(
-                index=index,
-                session_id=f"mock-session-{index}",
-                duration_s=duration_s,
-                ipc_ms=400,
-                transcribe_ms=1200,
-                postprocess_ms=400,
-                measured_ms=measured_ms,
-                inject_budget_ms=inject_budget_ms,
-                projected_total_ms=measured_ms + inject_budget_ms,
-                text_preview="slow transcript",
-                t0_iso="2026-01-01T00:00:00+00:00",
-                t1_iso="2026-01-01T00:00:01+00:00",
-                t2_iso="2026-01-01T00:00:02+00:00",
-                t3_iso="2026-01-01T00:00:03+00:00",
-            )
+    @staticmethod
+    def _run_main(
+        argv: list[str], run_iteration, env: dict[str, str] | None = None
+    ) -> tuple[int, str, str]:
+        """Run main() with argv and every sidecar-facing call patched out.
 
+        Returns the exit code plus captured stdout and stderr.
+        """
         stdout = io.StringIO()
         stderr = io.StringIO()
+        contexts = (
+            mock.patch.object(sys, "argv", argv),
+            mock.patch.dict("os.environ", env or {}),
+            mock.patch.object(latency_benchmark, "SidecarClient", _FakeClient),
+            mock.patch.object(latency_benchmark, "ensure_model_available"),
+            mock.patch.object(latency_benchmark, "initialize_model"),
+            mock.patch.object(latency_benchmark, "run_iteration", side_effect=run_iteration),
+            redirect_stdout(stdout),
+            redirect_stderr(stderr),
+        )
+        with ExitStack() as stack:
+            for context in contexts:
+                stack.enter_context(context)
+            rc = latency_benchmark.main()
+        return rc, stdout.getvalue(), stderr.getvalue()
+
+    def test_main_writes_runtime_json_report_contract(self) -> None:
+        tmp_dir = self._make_tmp_dir()
+        report_path = tmp_dir / "latency-report.json"
+
+        argv = [
+            "latency.py",
+            "--runs",
+            "3",
+            "--target-ms",
+            "1200",
+            "--inject-budget-ms",
+            "50",
+            "--json-out",
+            str(report_path),
+            "--no-playback-required",
+        ]
+
+        run_iteration = _make_fake_run_iteration(
+            base_measured_ms=300,
+            ipc_ms=80,
+            transcribe_ms=180,
+            postprocess_ms=40,
+            text_preview="mock transcript",
+        )
+        rc, stdout, stderr = self._run_main(argv, run_iteration)
+
+        self.assertEqual(rc, 0, msg=stderr)
+        self.assertTrue(report_path.is_file())
+
+        report = json.loads(report_path.read_text(encoding="utf-8"))
+        self.assertIn("generated_at", report)
+        self.assertIn("summary", report)
+        self.assertIn("runs", report)
+        self.assertEqual(len(report["runs"]), 3)
+        self.assertEqual(report["summary"]["count"], 3)
+        self.assertEqual(report["summary"]["inject_budget_ms"], 50)
+        self.assertIn("projected_median_ms", report["summary"])
+        self.assertIn("median_breakdown_ms", report["summary"])
+        self.assertIn("ipc", report["summary"]["median_breakdown_ms"])
+        self.assertIn("transcribe", report["summary"]["median_breakdown_ms"])
+        self.assertIn("postprocess", report["summary"]["median_breakdown_ms"])
+        self.assertIn("Latency benchmark (3 runs, after model warm):", stdout)
+
+    def test_main_returns_ci_informational_success_when_threshold_exceeded(self) -> None:
         argv = [
             "latency.py",
             "--runs",
@@ -216,17 +214,17 @@ class LatencyBenchmarkScriptTests(unittest.TestCase):
             "--no-playback-required",
         ]
 
-        with mock.patch.object(sys, "argv", argv):
-            with mock.patch.dict("os.environ", {"CI": "true"}, clear=False):
-                with mock.patch.object(latency_benchmark, "SidecarClient", FakeClient):
-                    with mock.patch.object(latency_benchmark, "ensure_model_available"):
-                        with mock.patch.object(latency_benchmark, "initialize_model"):
-                            with mock.patch.object(latency_benchmark, "run_iteration", side_effect=slow_run_iteration):
-                                with redirect_stdout(stdout), redirect_stderr(stderr):
-                                    rc = latency_benchmark.main()
-
-        self.assertEqual(rc, 0, msg=stderr.getvalue())
-        self.assertIn("[warn] projected median", stdout.getvalue())
+        run_iteration = _make_fake_run_iteration(
+            base_measured_ms=2000,
+            ipc_ms=400,
+            transcribe_ms=1200,
+            postprocess_ms=400,
+            text_preview="slow transcript",
+        )
+        rc, stdout, stderr = self._run_main(argv, run_iteration, env={"CI": "true"})
+
+        self.assertEqual(rc, 0, msg=stderr)
+        self.assertIn("[warn] projected median", stdout)
 
 
 if __name__ == "__main__":
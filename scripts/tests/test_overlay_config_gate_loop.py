@@ -1,12 +1,18 @@
 """Regression checks for overlay config-gate loop polling behavior."""
 
 import unittest
-from pathlib import Path
 
+from ._fixtures import ContainsAllMixin, read_text
+from ._paths import SRC_TAURI
 
-REPO_ROOT = Path(__file__).resolve().parents[2]
-INTEGRATION_RS = REPO_ROOT / "src-tauri" / "src" / "integration.rs"
-COMMANDS_RS = REPO_ROOT / "src-tauri" / "src" / "commands.rs"
+
+INTEGRATION_RS = SRC_TAURI / "integration.rs"
+COMMANDS_RS = SRC_TAURI / "commands.rs"
+
+CONFIG_CHANGE_NOTIFY_MARKERS = (
+    "manager.notify_overlay_config_changed();",
+    "tauri::async_runtime::spawn(async move",
+)
 
 
 def _extract_start_overlay_window_loop_block(source: str) -> str:
@@ -19,11 +25,11 @@ def _extract_start_overlay_window_loop_block(source: str) -> str:
     return source[start:end]
 
 
-class OverlayConfigGateLoopTests(unittest.TestCase):
+class OverlayConfigGateLoopTests(ContainsAllMixin, unittest.TestCase):
     @classmethod
     def setUpClass(cls) -> None:
-        cls.integration_text = INTEGRATION_RS.read_text(encoding="utf-8")
-        cls.commands_text = COMMANDS_RS.read_text(encoding="utf-8")
+        cls.integration_text = read_text(INTEGRATION_RS)
+        cls.commands_text = read_text(COMMANDS_RS)
         cls.overlay_loop_block = _extract_start_overlay_window_loop_block(cls.integration_text)
 
     def test_overlay_loop_waits_on_notify_instead_of_periodic_interval(self) -> None:
@@ -31,8 +37,7 @@ class OverlayConfigGateLoopTests(unittest.TestCase):
         self.assertNotIn("tokio::time::interval(", self.overlay_loop_block)
 
     def test_config_commands_notify_overlay_loop_on_changes(self) -> None:
-        self.assertIn("manager.notify_overlay_config_changed();", self.commands_text)
-        self.assertIn("tauri::async_runtime::spawn(async move", self.commands_text)
+        self.assertContainsAll(self.commands_text, CONFIG_CHANGE_NOTIFY_MARKERS)
 
 
 if __name__ == "__main__":
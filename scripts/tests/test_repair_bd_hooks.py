@@ -4,9 +4,10 @@ import tempfile
 import unittest
 from pathlib import Path
 
+from ._paths import SCRIPTS
 
-REPO_ROOT = Path(__file__).resolve().parents[2]
-REPAIR_SCRIPT = REPO_ROOT / "scripts" / "repair-bd-hooks.sh"
+
+REPAIR_SCRIPT = SCRIPTS / "repair-bd-hooks.sh"
 
 
 class RepairBdHooksTests(unittest.TestCase):
@@ -36,8 +37,8 @@ class RepairBdHooksTests(unittest.TestCase):
                 cwd=repo_root,
                 env=env,
                 check=True,
-                capture_output=True,
-                text=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
             )
 
             pre_commit_hook = hooks_dir / "pre-commit"
@@ -49,11 +50,10 @@ class RepairBdHooksTests(unittest.TestCase):
                 cwd=repo_root,
                 env=env,
                 capture_output=True,
-                text=True,
                 check=False,
             )
             self.assertEqual(result.returncode, 0)
-            self.assertIn("does not provide hook commands", result.stderr)
+            self.assertIn(b"does not provide hook commands", result.stderr)
 
 
 if __name__ == "__main__":
@@ -1,6 +1,8 @@
 import unittest
 from pathlib import Path
 
+from ._fixtures import read_text
+
 
 IPC_COMPLIANCE_PATH = Path("sidecar/tests/test_ipc_compliance.py")
 
@@ -8,7 +10,7 @@ IPC_COMPLIANCE_PATH = Path("sidecar/tests/test_ipc_compliance.py")
 class SidecarIpcComplianceReferenceTests(unittest.TestCase):
     @classmethod
     def setUpClass(cls) -> None:
-        cls.content = IPC_COMPLIANCE_PATH.read_text(encoding="utf-8")
+        cls.content = read_text(IPC_COMPLIANCE_PATH)
 
     def test_shutdown_orphan_check_not_linux_only(self) -> None:
         self.assertNotIn("requires Linux /proc support", self.content)
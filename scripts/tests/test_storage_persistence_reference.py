@@ -2,33 +2,44 @@
 
 import re
 import unittest
-from pathlib import Path
 
+from ._fixtures import ContainsAllMixin, read_text
+from ._paths import SHARED, SIDECAR_SRC, SRC_TAURI
 
-REPO_ROOT = Path(__file__).resolve().parents[2]
-REFERENCE = REPO_ROOT / "shared" / "STORAGE_PERSISTENCE_MODEL.md"
-LOG_BUFFER = REPO_ROOT / "src-tauri" / "src" / "log_buffer.rs"
-LIB_RS = REPO_ROOT / "src-tauri" / "src" / "lib.rs"
-CONFIG_RS = REPO_ROOT / "src-tauri" / "src" / "config.rs"
-HISTORY_PERSISTENCE_RS = REPO_ROOT / "src-tauri" / "src" / "history_persistence.rs"
-MODEL_CACHE_PY = REPO_ROOT / "sidecar" / "src" / "openvoicy_sidecar" / "model_cache.py"
 
+REFERENCE = SHARED / "STORAGE_PERSISTENCE_MODEL.md"
+LOG_BUFFER = SRC_TAURI / "log_buffer.rs"
+LIB_RS = SRC_TAURI / "lib.rs"
+CONFIG_RS = SRC_TAURI / "config.rs"
+HISTORY_PERSISTENCE_RS = SRC_TAURI / "history_persistence.rs"
+MODEL_CACHE_PY = SIDECAR_SRC / "model_cache.py"
 
-class StoragePersistenceReferenceTests(unittest.TestCase):
+_NO_LOG_SINK_RE = re.compile(
+    r"no persistent file-log sink or rotation path is implemented", re.IGNORECASE
+)
+_DISK_UNIMPLEMENTED_RE = re.compile(r"disk persistence.*not yet implemented", re.IGNORECASE)
+
+LOG_BUFFER_FORBIDDEN_FS_MARKERS = (
+    "OpenOptions",
+    "File::create",
+    "File::open",
+    "std::fs::File",
+    "create_dir_all",
+)
+
+
+class StoragePersistenceReferenceTests(ContainsAllMixin, unittest.TestCase):
     @classmethod
     def setUpClass(cls) -> None:
-        cls.reference_text = REFERENCE.read_text(encoding="utf-8")
-        cls.log_buffer_text = LOG_BUFFER.read_text(encoding="utf-8")
-        cls.lib_text = LIB_RS.read_text(encoding="utf-8")
-        cls.config_text = CONFIG_RS.read_text(encoding="utf-8")
-        cls.history_persistence_text = HISTORY_PERSISTENCE_RS.read_text(encoding="utf-8")
-        cls.model_cache_text = MODEL_CACHE_PY.read_text(encoding="utf-8")
+        cls.reference_text = read_text(REFERENCE)
+        cls.log_buffer_text = read_text(LOG_BUFFER)
+        cls.lib_text = read_text(LIB_RS)
+        cls.config_text = read_text(CONFIG_RS)
+        cls.history_persistence_text = read_text(HISTORY_PERSISTENCE_RS)
+        cls.model_cache_text = read_text(MODEL_CACHE_PY)
 
     def test_reference_states_no_persistent_log_sink_is_implemented(self) -> None:
-        self.assertRegex(
-            self.reference_text,
-            re.compile(r"no persistent file-log sink or rotation path is implemented", re.IGNORECASE),
-        )
+        self.assertRegex(self.reference_text, _NO_LOG_SINK_RE)
 
     def test_reference_does_not_claim_rotated_file_logs_exist_today(self) -> None:
         self.assertNotIn(
@@ -40,100 +51,123 @@ class StoragePersistenceReferenceTests(unittest.TestCase):
         self.assertIn("log_buffer::init_buffer_logger(log::Level::Info);", self.lib_text)
 
     def test_reference_describes_runtime_history_persistence_wiring(self) -> None:
-        self.assertIn("build_history_persistence", self.reference_text)
-        self.assertIn("TranscriptHistory::with_capacity_and_persistence", self.reference_text)
-        self.assertIn("history.jsonl", self.reference_text)
+        self.assertContainsAll(
+            self.reference_text,
+            (
+                "build_history_persistence",
+                "TranscriptHistory::with_capacity_and_persistence",
+                "history.jsonl",
+            ),
+        )
 
     def test_reference_describes_history_persistence_gating(self) -> None:
-        self.assertIn('history.persistence_mode != "disk"', self.reference_text)
-        self.assertIn('history.persistence_mode="disk"', self.reference_text)
-        self.assertIn("history.encrypt_at_rest=false", self.reference_text)
-        self.assertIn("keychain availability", self.reference_text)
-        self.assertIn("falls back to memory-only", self.reference_text)
-
-    def test_runtime_wires_history_persistence_backend(self) -> None:
-        self.assertIn("build_history_persistence(", self.lib_text)
-        self.assertIn("TranscriptHistory::with_capacity_and_persistence(", self.lib_text)
-
-    def test_history_persistence_module_implements_documented_gates(self) -> None:
-        self.assertIn('persistence_mode != "disk"', self.history_persistence_text)
-        self.assertIn("if !encrypt_at_rest", self.history_persistence_text)
-        self.assertIn("EncryptionProvider::from_keychain()", self.history_persistence_text)
-        self.assertIn("falling back to memory-only history", self.history_persistence_text.lower())
+        self.assertContainsAll(
+            self.reference_text,
+            (
+                'history.persistence_mode != "disk"',
+                'history.persistence_mode="disk"',
+                "history.encrypt_at_rest=false",
+                "keychain availability",
+                "falls back to memory-only",
+            ),
+        )
 
     def test_runtime_has_no_log_file_persistence_config_surface(self) -> None:
-        self.assertNotIn("log_persistence", self.config_text)
-        self.assertNotIn("log_file", self.config_text)
-        self.assertNotIn("log_path", self.config_text)
+        self.assertContainsNone(self.config_text, ("log_persistence", "log_file", "log_path"))
 
     def test_reference_documents_config_lifecycle_atomic_and_recovery_claims(self) -> None:
-        self.assertIn("config.json.tmp", self.reference_text)
-        self.assertIn("config.json.corrupt", self.reference_text)
-        self.assertIn("Rename `.tmp` to `config.json`", self.reference_text)
-        self.assertIn("rename bad file to `.corrupt`", self.reference_text)
-        self.assertIn("Migration must be additive", self.reference_text)
+        self.assertContainsAll(
+            self.reference_text,
+            (
+                "config.json.tmp",
+                "config.json.corrupt",
+                "Rename `.tmp` to `config.json`",
+                "rename bad file to `.corrupt`",
+                "Migration must be additive",
+            ),
+        )
 
     def test_runtime_config_implements_tmp_staging_and_atomic_replace(self) -> None:
-        self.assertIn('path.with_extension("json.tmp")', self.config_text)
-        self.assertIn("replace_config_file(&temp, path)", self.config_text)
-        self.assertIn("fn replace_config_file(temp: &PathBuf, path: &PathBuf)", self.config_text)
-        self.assertIn("fs::rename(temp, path)", self.config_text)
+        self.assertContainsAll(
+            self.config_text,
+            (
+                'path.with_extension("json.tmp")',
+                "replace_config_file(&temp, path)",
+                "fn replace_config_file(temp: &PathBuf, path: &PathBuf)",
+                "fs::rename(temp, path)",
+            ),
+        )
 
     def test_runtime_config_implements_corrupt_backup_and_migration_entrypoint(self) -> None:
-        self.assertIn('path.with_extension("json.corrupt")', self.config_text)
-        self.assertIn("Failed to backup corrupt config", self.config_text)
-        self.assertIn("fn migrate_config(mut config: Value) -> AppConfig", self.config_text)
-        self.assertIn("Future migrations go here", self.config_text)
-
-    def test_reference_mentions_history_persistence_config_fields(self) -> None:
-        self.assertIn("history.persistence_mode", self.reference_text)
-        self.assertIn("history.encrypt_at_rest", self.reference_text)
+        self.assertContainsAll(
+            self.config_text,
+            (
+                'path.with_extension("json.corrupt")',
+                "Failed to backup corrupt config",
+                "fn migrate_config(mut config: Value) -> AppConfig",
+                "Future migrations go here",
+            ),
+        )
 
     def test_reference_does_not_claim_history_disk_path_is_unimplemented(self) -> None:
-        self.assertNotRegex(
-            self.reference_text,
-            re.compile(r"disk persistence.*not yet implemented", re.IGNORECASE),
-        )
+        self.assertNotRegex(self.reference_text, _DISK_UNIMPLEMENTED_RE)
 
     def test_runtime_builds_history_persistence_backend(self) -> None:
-        self.assertIn("build_history_persistence(", self.lib_text)
-        self.assertIn("TranscriptHistory::with_capacity_and_persistence(", self.lib_text)
-        self.assertIn('config::config_dir().join("history.jsonl")', self.lib_text)
+        self.assertContainsAll(
+            self.lib_text,
+            (
+                "build_history_persistence(",
+                "TranscriptHistory::with_capacity_and_persistence(",
+                'config::config_dir().join("history.jsonl")',
+            ),
+        )
 
     def test_history_backend_contains_disk_and_encryption_gates(self) -> None:
-        self.assertIn('if persistence_mode != "disk"', self.history_persistence_text)
-        self.assertIn("if !encrypt_at_rest", self.history_persistence_text)
-        self.assertIn("EncryptionProvider::from_keychain()", self.history_persistence_text)
+        self.assertContainsAll(
+            self.history_persistence_text,
+            (
+                'if persistence_mode != "disk"',
+                "if !encrypt_at_rest",
+                "EncryptionProvider::from_keychain()",
+            ),
+        )
         self.assertIn(
             "falling back to memory-only history for privacy",
             self.history_persistence_text.lower(),
         )
 
     def test_log_buffer_module_has_no_filesystem_write_path(self) -> None:
-        forbidden_markers = [
-            "OpenOptions",
-            "File::create",
-            "File::open",
-            "std::fs::File",
-            "create_dir_all",
-        ]
-        for marker in forbidden_markers:
-            self.assertNotIn(marker, self.log_buffer_text)
+        self.assertContainsNone(self.log_buffer_text, LOG_BUFFER_FORBIDDEN_FS_MARKERS)
 
     def test_model_cache_module_uses_partial_staging_and_atomic_activation(self) -> None:
-        self.assertIn('partial_root = cache_dir / ".partial"', self.model_cache_text)
-        self.assertIn("temp_dir = partial_root / manifest.model_id", self.model_cache_text)
-        self.assertIn("_activate_staged_model_dir(temp_dir, model_dir)", self.model_cache_text)
+        self.assertContainsAll(
+            self.model_cache_text,
+            (
+                'partial_root = cache_dir / ".partial"',
+                "temp_dir = partial_root / manifest.model_id",
+                "_activate_staged_model_dir(temp_dir, model_dir)",
+            ),
+        )
 
     def test_model_cache_module_verifies_sha_and_size_before_activation(self) -> None:
-        self.assertIn("hash_ok, actual_sha256 = verify_sha256", self.model_cache_text)
-        self.assertIn("if actual_size != file_info.size_bytes", self.model_cache_text)
-        self.assertIn('"expected_size_bytes": file_info.size_bytes', self.model_cache_text)
+        self.assertContainsAll(
+            self.model_cache_text,
+            (
+                "hash_ok, actual_sha256 = verify_sha256",
+                "if actual_size != file_info.size_bytes",
+                '"expected_size_bytes": file_info.size_bytes',
+            ),
+        )
 
     def test_model_cache_module_purge_semantics_remove_model_directories(self) -> None:
-        self.assertIn("def purge_cache(self, model_id: Optional[str] = None)", self.model_cache_text)
-        self.assertIn("shutil.rmtree(model_dir)", self.model_cache_text)
-        self.assertIn("shutil.rmtree(item)", self.model_cache_text)
+        self.assertContainsAll(
+            self.model_cache_text,
+            (
+                "def purge_cache(self, model_id: Optional[str] = None)",
+                "shutil.rmtree(model_dir)",
+                "shutil.rmtree(item)",
+            ),
+        )
 
 
 if __name__ == "__main__":
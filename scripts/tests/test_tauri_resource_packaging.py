@@ -4,10 +4,10 @@ from __future__ import annotations
 
 import json
 import unittest
-from pathlib import Path
+
+from ._paths import REPO_ROOT
 
 
-REPO_ROOT = Path(__file__).resolve().parents[2]
 TAURI_CONF = REPO_ROOT / "src-tauri" / "tauri.conf.json"
 
 
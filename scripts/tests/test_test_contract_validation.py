@@ -1,28 +1,20 @@
-import importlib.util
 import contextlib
 import io
 import json
-import sys
 import tempfile
 import unittest
 from pathlib import Path
 from unittest.mock import patch
 
+from ._fixtures import load_script_module
+from ._paths import SCRIPTS
 
-SCRIPTS_DIR = Path(__file__).resolve().parents[1]
-VALIDATE_CONTRACTS_PATH = SCRIPTS_DIR / "validate_contracts.py"
-VALIDATE_SPEC = importlib.util.spec_from_file_location("validate_contracts", VALIDATE_CONTRACTS_PATH)
-VALIDATE_MODULE = importlib.util.module_from_spec(VALIDATE_SPEC)
-assert VALIDATE_SPEC and VALIDATE_SPEC.loader
-sys.modules[VALIDATE_SPEC.name] = VALIDATE_MODULE
-VALIDATE_SPEC.loader.exec_module(VALIDATE_MODULE)
 
-SCRIPT_PATH = SCRIPTS_DIR / "test_contract_validation.py"
-SPEC = importlib.util.spec_from_file_location("test_contract_validation", SCRIPT_PATH)
-MODULE = importlib.util.module_from_spec(SPEC)
-assert SPEC and SPEC.loader
-sys.modules[SPEC.name] = MODULE
-SPEC.loader.exec_module(MODULE)
+VALIDATE_CONTRACTS_PATH = SCRIPTS / "validate_contracts.py"
+VALIDATE_MODULE = load_script_module("validate_contracts", VALIDATE_CONTRACTS_PATH)
+
+SCRIPT_PATH = SCRIPTS / "test_contract_validation.py"
+MODULE = load_script_module("test_contract_validation", SCRIPT_PATH)
 
 
 class TestContractValidationTests(unittest.TestCase):
@@ -1,4 +1,3 @@
-import importlib.util
 import io
 import json
 import sys
@@ -8,13 +7,12 @@ import warnings
 from contextlib import redirect_stdout
 from pathlib import Path
 
+from ._fixtures import load_script_module
+from ._paths import SCRIPTS
 
-SCRIPT_PATH = Path(__file__).resolve().parents[1] / "validate_contracts.py"
-SPEC = importlib.util.spec_from_file_location("validate_contracts", SCRIPT_PATH)
-MODULE = importlib.util.module_from_spec(SPEC)
-assert SPEC and SPEC.loader
-sys.modules[SPEC.name] = MODULE
-SPEC.loader.exec_module(MODULE)
+
+SCRIPT_PATH = SCRIPTS / "validate_contracts.py"
+MODULE = load_script_module("validate_contracts", SCRIPT_PATH)
 
 
 class ValidateContractsTests(unittest.TestCase):
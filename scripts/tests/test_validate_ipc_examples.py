@@ -1,15 +1,14 @@
-import importlib.util
 import json
 import tempfile
 import unittest
 from pathlib import Path
 
+from ._fixtures import load_script_module
+from ._paths import SCRIPTS
 
-SCRIPT_PATH = Path(__file__).resolve().parents[1] / "validate_ipc_examples.py"
-SPEC = importlib.util.spec_from_file_location("validate_ipc_examples", SCRIPT_PATH)
-MODULE = importlib.util.module_from_spec(SPEC)
-assert SPEC and SPEC.loader
-SPEC.loader.exec_module(MODULE)
+
+SCRIPT_PATH = SCRIPTS / "validate_ipc_examples.py"
+MODULE = load_script_module("validate_ipc_examples", SCRIPT_PATH)
 
 
 class ValidateIPCExamplesTests(unittest.TestCase):
@@ -1,15 +1,14 @@
-import importlib.util
 import json
 import tempfile
 import unittest
 from pathlib import Path
 
+from ._fixtures import load_script_module
+from ._paths import REPO_ROOT, SCRIPTS, SHARED
 
-SCRIPT_PATH = Path(__file__).resolve().parents[1] / "validate_model_manifest.py"
-SPEC = importlib.util.spec_from_file_location("validate_model_manifest", SCRIPT_PATH)
-MODULE = importlib.util.module_from_spec(SPEC)
-assert SPEC and SPEC.loader
-SPEC.loader.exec_module(MODULE)
+
+SCRIPT_PATH = SCRIPTS / "validate_model_manifest.py"
+MODULE = load_script_module("validate_model_manifest", SCRIPT_PATH)
 
 
 class ValidateModelManifestTests(unittest.TestCase):
@@ -160,7 +159,7 @@ class ValidateModelManifestTests(unittest.TestCase):
             self.assertEqual(MODULE.validate_rust_model_defaults(manifest, repo_root), [])
 
     def test_validate_document_against_schema_catalog_passes(self) -> None:
-        schema_path = Path(__file__).resolve().parents[2] / "shared" / "schema" / "ModelCatalog.schema.json"
+        schema_path = SHARED / "schema" / "ModelCatalog.schema.json"
         schema = json.loads(schema_path.read_text())
         catalog = {
             "schema_version": 1,
@@ -277,7 +276,7 @@ class ValidateModelManifestTests(unittest.TestCase):
                     }
                 )
             )
-            schema_path = Path(__file__).resolve().parents[2] / "shared" / "schema" / "ModelManifest.schema.json"
+            schema_path = SHARED / "schema" / "ModelManifest.schema.json"
             schema = json.loads(schema_path.read_text())
 
             errors, _ = MODULE.validate_manifests_directory(manifests_dir, schema, repo_root)
@@ -287,7 +286,7 @@ class ValidateModelManifestTests(unittest.TestCase):
 
     def test_catalog_schema_rejects_missing_required_field(self) -> None:
         """Missing required field in catalog entry -> validation failure."""
-        schema_path = Path(__file__).resolve().parents[2] / "shared" / "schema" / "ModelCatalog.schema.json"
+        schema_path = SHARED / "schema" / "ModelCatalog.schema.json"
         schema = json.loads(schema_path.read_text())
         catalog = {
             "schema_version": 1,
@@ -304,7 +303,7 @@ class ValidateModelManifestTests(unittest.TestCase):
 
     def test_catalog_schema_rejects_empty_supported_languages(self) -> None:
         """supported_languages must have at least one entry."""
-        schema_path = Path(__file__).resolve().parents[2] / "shared" / "schema" / "ModelCatalog.schema.json"
+        schema_path = SHARED / "schema" / "ModelCatalog.schema.json"
         schema = json.loads(schema_path.read_text())
         catalog = {
             "schema_version": 1,
@@ -326,7 +325,7 @@ class ValidateModelManifestTests(unittest.TestCase):
 
     def test_catalog_schema_rejects_unknown_family_enum(self) -> None:
         """family must stay aligned with supported backend allowlist."""
-        schema_path = Path(__file__).resolve().parents[2] / "shared" / "schema" / "ModelCatalog.schema.json"
+        schema_path = SHARED / "schema" / "ModelCatalog.schema.json"
         schema = json.loads(schema_path.read_text())
         catalog = {
             "schema_version": 1,
@@ -351,7 +350,7 @@ class ValidateModelManifestTests(unittest.TestCase):
 
     def test_catalog_schema_rejects_unsupported_family(self) -> None:
         """family must stay aligned with supported backend allowlist."""
-        schema_path = Path(__file__).resolve().parents[2] / "shared" / "schema" / "ModelCatalog.schema.json"
+        schema_path = SHARED / "schema" / "ModelCatalog.schema.json"
         schema = json.loads(schema_path.read_text())
         catalog = {
             "schema_version": 1,
@@ -373,7 +372,7 @@ class ValidateModelManifestTests(unittest.TestCase):
 
     def test_catalog_schema_accepts_whisper_family(self) -> None:
         """whisper remains a valid family enum value."""
-        schema_path = Path(__file__).resolve().parents[2] / "shared" / "schema" / "ModelCatalog.schema.json"
+        schema_path = SHARED / "schema" / "ModelCatalog.schema.json"
         schema = json.loads(schema_path.read_text())
         catalog = {
             "schema_version": 1,
@@ -397,7 +396,7 @@ class ValidateModelManifestTests(unittest.TestCase):
 
     def test_manifest_schema_validates_valid_manifest(self) -> None:
         """Valid per-model manifest validates successfully."""
-        schema_path = Path(__file__).resolve().parents[2] / "shared" / "schema" / "ModelManifest.schema.json"
+        schema_path = SHARED / "schema" / "ModelManifest.schema.json"
         schema = json.loads(schema_path.read_text())
         manifest = {
             "model_id": "nvidia/parakeet-tdt-0.6b-v3",
@@ -418,7 +417,7 @@ class ValidateModelManifestTests(unittest.TestCase):
 
     def test_manifest_schema_rejects_http_urls(self) -> None:
         """Manifest urls must use https://."""
-        schema_path = Path(__file__).resolve().parents[2] / "shared" / "schema" / "ModelManifest.schema.json"
+        schema_path = SHARED / "schema" / "ModelManifest.schema.json"
         schema = json.loads(schema_path.read_text())
         manifest = {
             "model_id": "nvidia/parakeet-tdt-0.6b-v3",
@@ -438,7 +437,7 @@ class ValidateModelManifestTests(unittest.TestCase):
 
     def test_manifest_schema_rejects_missing_files(self) -> None:
         """Manifest must have files array."""
-        schema_path = Path(__file__).resolve().parents[2] / "shared" / "schema" / "ModelManifest.schema.json"
+        schema_path = SHARED / "schema" / "ModelManifest.schema.json"
         schema = json.loads(schema_path.read_text())
         manifest = {
             "model_id": "nvidia/parakeet-tdt-0.6b-v3",
@@ -450,7 +449,7 @@ class ValidateModelManifestTests(unittest.TestCase):
 
     def test_manifest_schema_requires_model_family(self) -> None:
         """model_family is required for backend dispatch alignment."""
-        schema_path = Path(__file__).resolve().parents[2] / "shared" / "schema" / "ModelManifest.schema.json"
+        schema_path = SHARED / "schema" / "ModelManifest.schema.json"
         schema = json.loads(schema_path.read_text())
         manifest = {
             "model_id": "nvidia/parakeet-tdt-0.6b-v3",
@@ -469,7 +468,7 @@ class ValidateModelManifestTests(unittest.TestCase):
 
     def test_manifest_schema_rejects_non_positive_size_bytes(self) -> None:
         """size_bytes must be strictly positive."""
-        schema_path = Path(__file__).resolve().parents[2] / "shared" / "schema" / "ModelManifest.schema.json"
+        schema_path = SHARED / "schema" / "ModelManifest.schema.json"
         schema = json.loads(schema_path.read_text())
         manifest = {
             "model_id": "nvidia/parakeet-tdt-0.6b-v3",
@@ -512,7 +511,7 @@ class ValidateModelManifestTests(unittest.TestCase):
                     }
                 )
             )
-            schema_path = Path(__file__).resolve().parents[2] / "shared" / "schema" / "ModelManifest.schema.json"
+            schema_path = SHARED / "schema" / "ModelManifest.schema.json"
             schema = json.loads(schema_path.read_text())
 
             errors, docs = MODULE.validate_manifests_directory(manifests_dir, schema, repo_root)
@@ -521,7 +520,7 @@ class ValidateModelManifestTests(unittest.TestCase):
 
     def test_validate_real_catalog_against_schema(self) -> None:
         """The actual MODEL_CATALOG.json validates against schema."""
-        repo_root = Path(__file__).resolve().parents[2]
+        repo_root = REPO_ROOT
         schema_path = repo_root / "shared" / "schema" / "ModelCatalog.schema.json"
         catalog_path = repo_root / "shared" / "model" / "MODEL_CATALOG.json"
 
@@ -533,7 +532,7 @@ class ValidateModelManifestTests(unittest.TestCase):
 
     def test_validate_real_manifests_against_schema(self) -> None:
         """All manifests in manifests/ validate against schema."""
-        repo_root = Path(__file__).resolve().parents[2]
+        repo_root = REPO_ROOT
         schema_path = repo_root / "shared" / "schema" / "ModelManifest.schema.json"
         manifests_dir = repo_root / "shared" / "model" / "manifests"
 